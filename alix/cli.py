@@ -1,32 +1,122 @@
 import click
-import subprocess
+import functools
+import heapq
 from pathlib import Path
 from datetime import datetime
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.prompt import Confirm
-from rich.markdown import Markdown
+from operator import attrgetter, itemgetter
 
 from alix import __version__
-from alix.models import Alias
-from alix.storage import AliasStorage
-from alix.shell_integrator import ShellIntegrator
-from alix.shell_detector import ShellType
-from alix.scanner import AliasScanner
-from alix.porter import AliasPorter
-from alix.config import Config
-from alix.history_manager import HistoryManager
-from click.shell_completion import shell_complete as _click_shell_complete
-from alix.shell_wrapper import ShellWrapper
 import json
-from alix.render import Render
-from alix.template_manager import TemplateManager
 
-console = Console()
-storage = AliasStorage()
-config = Config()
-render = Render()
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class _LazyProxy:
+    """Forward attribute access to an object that is only built on first use"""
+
+    def __init__(self, factory):
+        object.__setattr__(self, "_factory", factory)
+
+    def __getattr__(self, name):
+        return getattr(self._factory(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._factory(), name, value)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_console():
+    """Create the Rich console once, the first time a command prints"""
+    from rich.console import Console
+
+    return Console()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_storage():
+    """Load the alias storage once, the first time a command needs it"""
+    from alix.storage import AliasStorage
+
+    return AliasStorage()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_config():
+    """Load the user configuration once, the first time a command needs it"""
+    from alix.config import Config
+
+    return Config()
+
+
+console = _LazyProxy(_get_console)
+storage = _LazyProxy(_get_storage)
+config = _LazyProxy(_get_config)
+
+# Above this many rows, listings skip Rich's table layout and print plain aligned columns
+PLAIN_LIST_THRESHOLD = 500
+
+# Color and icon for each history operation type in list-undo/list-redo
+OP_TYPE_STYLES = {
+    "add": ("green", "➕"),
+    "remove": ("red", "➖"),
+    "edit": ("yellow", "✏️"),
+    "import": ("blue", "📥"),
+    "group_add": ("cyan", "📁➕"),
+    "group_remove": ("cyan", "📁➖"),
+    "group_delete": ("red", "📁✖️"),
+    "group_import": ("blue", "📁📥"),
+    "tag_add": ("magenta", "🏷️➕"),
+    "tag_remove": ("magenta", "🏷️➖"),
+    "tag_rename": ("yellow", "🏷️✏️"),
+    "tag_delete": ("red", "🏷️✖️"),
+}
+
+
+def _read_json(path):
+    """Parse a JSON file, using orjson when it is installed"""
+    with open(path, "rb") as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _truncate(text, width):
+    """Cut text to width characters, marking the cut with an ellipsis"""
+    return text if len(text) <= width else text[:width] + "..."
+
+
+@functools.lru_cache(maxsize=8)
+def _completion_script(shell, prog_name="alix", complete_var="_ALIX_COMPLETE"):
+    """Render Click's completion script for shell once, or None if the shell is unsupported"""
+    from click.shell_completion import get_completion_class
+
+    completion_cls = get_completion_class(shell)
+    if completion_cls is None:
+        return None
+    return completion_cls(main, {}, prog_name, complete_var).source()
+
+
+def _display_timestamp(timestamp):
+    """Show a stored ISO timestamp as 'YYYY-MM-DD HH:MM:SS' by slicing it instead of parsing it"""
+    if isinstance(timestamp, str) and len(timestamp) >= 19 and timestamp[10] == "T":
+        return f"{timestamp[:10]} {timestamp[11:19]}"
+    return timestamp
+
+
+def _print_plain_rows(rows):
+    """Print rows as aligned plain-text columns in a single write"""
+    from rich.cells import cell_len
+
+    # Measure in terminal cells so wide characters keep the columns aligned
+    cell_rows = [[(cell, cell_len(cell)) for cell in row] for row in rows]
+    widths = [max(cells for _, cells in column) for column in zip(*cell_rows)]
+    lines = (
+        "  ".join(cell + " " * (width - cells) for (cell, cells), width in zip(row, widths)).rstrip()
+        for row in cell_rows
+    )
+    console.print("\n".join(lines), markup=False, highlight=False, soft_wrap=True)
 
 
 @click.group(invoke_without_command=True)
@@ -53,6 +143,10 @@ def main(ctx):
 @click.option("--force", is_flag=True, help="Force apply new alias over existing aliases/commands")
 def add(name, command, description, tags, no_apply, force):
     """Add a new alias to your collection and apply it immediately"""
+    from alix.models import Alias
+    from alix.scanner import AliasScanner
+    from alix.shell_integrator import ShellIntegrator
+
     msg = None
 
     command_exists = False
@@ -62,20 +156,8 @@ def add(name, command, description, tags, no_apply, force):
         msg = f"[red]✗[/] Alias '{name}' already exists in alix!\nEdit the alias to override it"
 
     if not command_exists:
-        cmd = subprocess.run(
-            [
-                "bash",
-                "-i",
-                "-c",
-                f"(alias; declare -f) | /usr/bin/which --tty-only --read-alias --read-functions --show-tilde --show-dot {name}",
-            ],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if cmd.returncode == 0:
-            command_exists = True
-            msg = cmd.stdout
+        msg = AliasScanner().find_existing_command(name)
+        command_exists = msg is not None
 
     if command_exists and not force:
         console.print("[red]Alias/Command/Function already exists. Add --force flag to override")
@@ -85,7 +167,7 @@ def add(name, command, description, tags, no_apply, force):
     # Parse tags if provided
     tag_list = []
     if tags:
-        tag_list = [tag.strip() for tag in tags.split(",") if tag.strip()]
+        tag_list = [stripped for tag in tags.split(",") if (stripped := tag.strip())]
 
     alias = Alias(name=name, command=command, description=description, tags=tag_list)
     if storage.add(alias, record_history=True):
@@ -93,13 +175,14 @@ def add(name, command, description, tags, no_apply, force):
 
         # Auto-apply to shell unless disabled
         if not no_apply:
-            integrator = ShellIntegrator()
-            success, message = integrator.apply_single_alias(alias)
+            integrator = ShellIntegrator(storage)
+            target_file = integrator.get_target_file()
+            success, message = integrator.apply_single_alias(alias, target_file=target_file)
 
             if success:
                 console.print(f"[green]✔[/] {message}")
                 console.print(f"[dim]💡 Alias '{name}' is now available in new shell sessions[/]")
-                console.print(f"[dim]   For current session, run: source ~/{integrator.get_target_file().name}[/]")
+                console.print(f"[dim]   For current session, run: source ~/{target_file.name}[/]")
             else:
                 console.print(f"[yellow]⚠[/] Alias saved but not applied: {message}")
                 console.print(f"[dim]   Run 'alix apply' to apply all aliases to shell[/]")
@@ -114,6 +197,9 @@ def add(name, command, description, tags, no_apply, force):
 @click.option("--no-apply", is_flag=True, help="Don't apply to shell immediately")
 def edit(name, command, description, no_apply):
     """Add a new alias to your collection and apply it immediately"""
+    from alix.models import Alias
+    from alix.shell_integrator import ShellIntegrator
+
     msg = None
 
     alias = storage.get(name)
@@ -140,8 +226,7 @@ def edit(name, command, description, no_apply):
         if description:
             alias.description = description
 
-        storage.remove(alias.name, record_history=False)
-        storage.add(alias, record_history=False)
+        storage.update(alias)
 
         # Record history for edit operation
         history_op = {
@@ -155,13 +240,14 @@ def edit(name, command, description, no_apply):
         console.print(f"[green]✔[/] Edited alias: [cyan]{name}[/] = '{alias.command}'")
 
         if not no_apply:
-            integrator = ShellIntegrator()
-            success, message = integrator.apply_single_alias(alias)
+            integrator = ShellIntegrator(storage)
+            target_file = integrator.get_target_file()
+            success, message = integrator.apply_single_alias(alias, target_file=target_file)
 
             if success:
                 console.print(f"[green]✔[/] {message}")
                 console.print(f"[dim]💡 Alias '{name}' is now available in new shell sessions[/]")
-                console.print(f"[dim]   For current session, run: source ~/{integrator.get_target_file().name}[/]")
+                console.print(f"[dim]   For current session, run: source ~/{target_file.name}[/]")
             else:
                 console.print(f"[yellow]⚠[/] Alias saved but not applied: {message}")
                 console.print(f"[dim]   Run 'alix apply' to apply all aliases to shell[/]")
@@ -180,9 +266,9 @@ def edit(name, command, description, no_apply):
 @click.option("--tag", "-t", help="Add a tag to all imported aliases")
 def scan(merge, source, file, tag):
     """Scan and import existing aliases from your system"""
+    from alix.scanner import AliasScanner
+
     scanner = AliasScanner()
-    imported_count = 0
-    skipped_count = 0
 
     if source == "file" and file:
         # Import from specific file
@@ -194,38 +280,36 @@ def scan(merge, source, file, tag):
         aliases = scanner.get_active_aliases()
         console.print(f"[cyan]Found {len(aliases)} active aliases[/]")
     else:
-        # Import from all system files
-        results = scanner.scan_system()
-        aliases = []
-        for filename, file_aliases in results.items():
-            console.print(f"[dim]  {filename}: {len(file_aliases)} aliases[/]")
-            aliases.extend(file_aliases)
-        console.print(f"[cyan]Found {len(aliases)} total aliases in system files[/]")
+        # Import from all system files, one file at a time as they are scanned
+        def iter_system_aliases():
+            total = 0
+            for filename, file_aliases in scanner.iter_scan_system():
+                console.print(f"[dim]  {filename}: {len(file_aliases)} aliases[/]")
+                total += len(file_aliases)
+                yield from file_aliases
+            console.print(f"[cyan]Found {total} total aliases in system files[/]")
+
+        aliases = iter_system_aliases()
+
+    def tagged(aliases):
+        # Add tag if specified
+        for alias in aliases:
+            if tag and tag not in alias.tags:
+                alias.tags.append(tag)
+            yield alias
 
-    if not aliases:
+    # Import aliases with a single backup and save
+    imported, skipped_count = storage.add_many(tagged(aliases), skip_existing=merge)
+    if not imported and not skipped_count:
         console.print("[yellow]No aliases found to import[/]")
         return
 
-    # Import aliases
-    for alias in aliases:
-        if alias.name in storage.aliases:
-            if merge:
-                skipped_count += 1
-                continue
-            else:
-                storage.remove(alias.name, record_history=True)
-
-        # Add tag if specified
-        if tag and tag not in alias.tags:
-            alias.tags.append(tag)
-
-        if storage.add(alias, record_history=True):
-            imported_count += 1
-            console.print(f"[green]✔[/] Imported: [cyan]{alias.name}[/]")
+    if imported:
+        console.print("\n".join(f"[green]✔[/] Imported: [cyan]{alias.name}[/]" for alias in imported))
 
     # Summary
     console.print("\n[bold green]Import Complete![/]")
-    console.print(f"  Imported: {imported_count} aliases")
+    console.print(f"  Imported: {len(imported)} aliases")
     if skipped_count > 0:
         console.print(f"  Skipped: {skipped_count} existing aliases")
 
@@ -244,9 +328,10 @@ def completion(shell, install):
       alix completion zsh --install
       alix completion fish
     """
-    prog_name = "alix"
+    from alix.shell_detector import ShellType
+    from alix.shell_integrator import ShellIntegrator
 
-    integrator = ShellIntegrator()
+    integrator = ShellIntegrator(storage)
     detected = integrator.shell_type
 
     target_shell = shell or (detected.value if detected else None)
@@ -254,21 +339,11 @@ def completion(shell, install):
         console.print("[red]Unable to determine shell. Specify one of: bash, zsh, fish[/]")
         return
 
-    # FIXED: Updated to use Click 8.x shell completion API
-    instruction = f"{target_shell}_source"
-    complete_var = "_ALIX_COMPLETE"
-
-    # Get the shell completion script
-    from click.shell_completion import get_completion
-
-    # Get the appropriate completion class
-    completion_cls = get_completion(target_shell, prog_name, complete_var)
-    if not completion_cls:
+    script = _completion_script(target_shell)
+    if script is None:
         console.print(f"[red]Unsupported shell: {target_shell}[/]")
         return
 
-    script = completion_cls.source()
-
     if install:
         try:
             success, message = integrator.install_completions(script, ShellType(target_shell))
@@ -290,9 +365,14 @@ def completion(shell, install):
 @click.option("--file", "-f", type=click.Path(), help="Custom config file path")
 @click.option("--install-completions", is_flag=True, help="Also install shell completions for this shell")
 @click.option("--dry-run", is_flag=True, help="Allow users to preview what changes before applying")
-def apply(shell, file, install_completions, dry_run):
+@click.option("--yes", "-y", is_flag=True, help="Skip the confirmation prompt")
+def apply(shell, file, install_completions, dry_run, yes):
     """Apply all aliases to your shell configuration"""
-    integrator = ShellIntegrator()
+    from alix.render import Render
+    from alix.shell_detector import ShellType
+    from alix.shell_integrator import ShellIntegrator
+
+    integrator = ShellIntegrator(storage)
 
     # Override shell type if specified
     if shell:
@@ -317,19 +397,16 @@ def apply(shell, file, install_completions, dry_run):
         console.print("[dim]Try specifying a file with --file option[/]")
         return
 
-    # Show what will be done
-    aliases = storage.list_all()
-
     # Preview what will be changes
     if dry_run:
         old_config, new_config = integrator.preview_aliases(target_file)
-        render.side_by_side_diff(old_config, new_config)
+        Render().side_by_side_diff(old_config, new_config)
 
     # Confirmation
-    if not click.confirm("Apply all aliases to shell config?"):
+    if not yes and not click.confirm("Apply all aliases to shell config?"):
         return
 
-    console.print(f"[cyan]Applying {len(aliases)} aliases to: {target_file}[/]")
+    console.print(f"[cyan]Applying {storage.count()} aliases to: {target_file}[/]")
 
     # Apply aliases
     success, message = integrator.apply_aliases(target_file)
@@ -346,15 +423,9 @@ def apply(shell, file, install_completions, dry_run):
 
     if install_completions:
         target_shell_str = integrator.shell_type.value if not shell else shell.lower()
-        prog_name = "alix"
-        complete_var = "_ALIX_COMPLETE"
-
-        # FIXED: Updated to use Click 8.x shell completion API
-        from click.shell_completion import get_completion
 
-        completion_cls = get_completion(target_shell_str, prog_name, complete_var)
-        if completion_cls:
-            script = completion_cls.source()
+        script = _completion_script(target_shell_str)
+        if script is not None:
             ok, msg = integrator.install_completions(script, ShellType(target_shell_str))
             if ok:
                 console.print(f"[green]✔[/] {msg}")
@@ -369,6 +440,9 @@ def apply(shell, file, install_completions, dry_run):
 @click.option("--export", "-e", type=click.Path(), help="Export analytics to file")
 def stats(detailed, export):
     """Show comprehensive statistics and usage analytics about your aliases"""
+    from rich.panel import Panel
+    from rich.table import Table
+
     aliases = storage.list_all()
 
     if not aliases:
@@ -376,20 +450,22 @@ def stats(detailed, export):
         return
 
     # Get usage analytics
-    analytics = storage.get_usage_analytics()
+    analytics = storage.get_usage_analytics(aliases, top_k=10)
 
-    # Basic statistics
+    # Basic statistics, gathered in a single pass
     total = len(aliases)
-    total_chars_saved = sum(len(a.command) - len(a.name) for a in aliases)
-    avg_length = sum(len(a.command) for a in aliases) / total if total > 0 else 0
-    most_used = max(aliases, key=lambda a: a.used_count) if aliases else None
-    newest = max(aliases, key=lambda a: a.created_at) if aliases else None
-
-    # Shell distribution
-    shells = {}
+    total_chars_saved = 0
+    total_command_length = 0
+    most_used = None
+    newest = None
     for alias in aliases:
-        shell = alias.shell or "unspecified"
-        shells[shell] = shells.get(shell, 0) + 1
+        total_command_length += len(alias.command)
+        total_chars_saved += alias.chars_saved
+        if most_used is None or alias.used_count > most_used.used_count:
+            most_used = alias
+        if newest is None or alias.created_at > newest.created_at:
+            newest = alias
+    avg_length = total_command_length / total
 
     # Create enhanced stats panel
     stats_text = f"""
@@ -405,29 +481,32 @@ def stats(detailed, export):
 [yellow]Unused Aliases:[/] {len(analytics['unused_aliases'])}
 [yellow]Recently Used (7 days):[/] {len(analytics['recently_used'])}
 [yellow]Storage:[/] {storage.storage_path.name}
-[yellow]Backups:[/] {len(list(storage.backup_dir.glob('*.json')))} files"""
+[yellow]Backups:[/] {storage.backup_count} files"""
 
     console.print(Panel.fit(stats_text, border_style="cyan"))
 
     # Show detailed analytics if requested
     if detailed:
         console.print("\n[bold cyan]📈 Detailed Usage Analytics[/]")
+        by_name = {alias.name: alias for alias in aliases}
 
         # Unused aliases
         if analytics["unused_aliases"]:
             console.print(f"\n[yellow]⚠️  Unused Aliases ({len(analytics['unused_aliases'])}):[/]")
-            for alias_name in analytics["unused_aliases"][:10]:  # Show first 10
-                console.print(f"  • [dim]{alias_name}[/]")
+            console.print("\n".join(  # Show first 10
+                f"  • [dim]{alias_name}[/]" for alias_name in analytics["unused_aliases"][:10]
+            ))
             if len(analytics["unused_aliases"]) > 10:
                 console.print(f"  ... and {len(analytics['unused_aliases']) - 10} more")
 
         # Recently used aliases
         if analytics["recently_used"]:
             console.print(f"\n[green]🔥 Recently Used (7 days):[/]")
-            for alias_name in analytics["recently_used"][:10]:  # Show first 10
-                alias = storage.get(alias_name)
-                if alias:
-                    console.print(f"  • [cyan]{alias_name}[/] - {alias.used_count} uses")
+            console.print("\n".join(  # Show first 10
+                f"  • [cyan]{alias_name}[/] - {by_name[alias_name].used_count} uses"
+                for alias_name in analytics["recently_used"][:10]
+                if alias_name in by_name
+            ))
 
         # Most productive aliases
         if analytics["most_productive_aliases"]:
@@ -438,8 +517,8 @@ def stats(detailed, export):
             table.add_column("Chars Saved", style="green")
             table.add_column("Usage Count", style="yellow")
 
-            for i, (alias_name, chars_saved) in enumerate(analytics["most_productive_aliases"][:10], 1):
-                alias = storage.get(alias_name)
+            for i, (alias_name, chars_saved) in enumerate(analytics["most_productive_aliases"], 1):
+                alias = by_name.get(alias_name)
                 usage_count = alias.used_count if alias else 0
                 table.add_row(f"{i}.", alias_name, str(chars_saved), str(usage_count))
             console.print(table)
@@ -447,23 +526,19 @@ def stats(detailed, export):
         # Usage trends (last 7 days)
         if analytics["usage_trends"]:
             console.print(f"\n[bold]📅 Usage Trends (Last 7 Days):[/]")
-            recent_days = sorted(analytics["usage_trends"].items(), reverse=True)[:7]
-            for date, count in recent_days:
-                console.print(f"  {date}: {count} uses")
+            recent_days = heapq.nlargest(7, analytics["usage_trends"].items(), key=itemgetter(0))
+            console.print("\n".join(f"  {date}: {count} uses" for date, count in recent_days))
 
     # Show top 5 space savers
     console.print(f"\n[bold]🏆 Top Commands by Length Saved:[/]")
-    sorted_aliases = sorted(aliases, key=lambda a: len(a.command) - len(a.name), reverse=True)[:5]
-
-    sorted_aliases = sorted(aliases, key=lambda a: len(a.command) - len(a.name), reverse=True)[:5]
+    sorted_aliases = heapq.nlargest(5, aliases, key=attrgetter("chars_saved"))
     table = Table(show_header=False, box=None, padding=(0, 2))
     for i, alias in enumerate(sorted_aliases, 1):
-        saved = len(alias.command) - len(alias.name)
         table.add_row(
             f"{i}.",
             f"[cyan]{alias.name}[/]",
-            f"saves {saved} chars",
-            (f"[dim]({alias.command[:30]}...)[/]" if len(alias.command) > 30 else f"[dim]({alias.command})[/]"),
+            f"saves {alias.chars_saved} chars",
+            f"[dim]({_truncate(alias.command, 30)})[/]",
         )
     console.print(table)
 
@@ -479,19 +554,18 @@ def stats(detailed, export):
 @click.option("--context", "-c", help="Additional context for this usage")
 def track(alias_name, context):
     """Manually track usage of an alias"""
-    alias = storage.get(alias_name)
+    # The tracking wrapper runs this on every alias call, so plain click output keeps Rich from loading
+    alias = storage.track_usage(alias_name, context)
     if not alias:
-        console.print(f"[red]✗[/] Alias '{alias_name}' not found!")
+        click.echo(f"{click.style('✗', fg='red')} Alias '{alias_name}' not found!")
         return
 
-    storage.track_usage(alias_name, context)
-    console.print(f"[green]✔[/] Tracked usage of alias '{alias_name}'")
+    click.echo(f"{click.style('✔', fg='green')} Tracked usage of alias '{alias_name}'")
 
     # Show updated stats
-    alias = storage.get(alias_name)  # Get updated alias
-    console.print(f"[dim]Total uses: {alias.used_count}[/]")
+    click.secho(f"Total uses: {alias.used_count}", dim=True)
     if alias.last_used:
-        console.print(f"[dim]Last used: {alias.last_used.strftime('%Y-%m-%d %H:%M:%S')}[/]")
+        click.secho(f"Last used: {alias.last_used.strftime('%Y-%m-%d %H:%M:%S')}", dim=True)
 
 
 @main.command()
@@ -533,67 +607,27 @@ def list_undo():
     console.print("[bold cyan]📚 Undo History (most recent last):[/]")
     console.print(f"[dim]Use 'alix undo --id <number>' to undo a specific operation[/]")
 
+    # Collect every entry and print once; each console.print re-enters Rich's render pipeline
+    lines = []
     for i, op in enumerate(undo_ops, 1):
         op_type = op.get("type", "unknown")
         aliases = [a.get("name", "N/A") for a in op.get("aliases", [])]
         timestamp = op.get("timestamp", "N/A")
 
         # Format timestamp for better readability
-        try:
-            from datetime import datetime
-            dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-            formatted_time = dt.strftime("%Y-%m-%d %H:%M:%S")
-        except:
-            formatted_time = timestamp
+        formatted_time = _display_timestamp(timestamp)
 
         # Color code by operation type
-        if op_type == "add":
-            type_color = "green"
-            type_icon = "➕"
-        elif op_type == "remove":
-            type_color = "red"
-            type_icon = "➖"
-        elif op_type == "edit":
-            type_color = "yellow"
-            type_icon = "✏️"
-        elif op_type == "import":
-            type_color = "blue"
-            type_icon = "📥"
-        elif op_type == "group_add":
-            type_color = "cyan"
-            type_icon = "📁➕"
-        elif op_type == "group_remove":
-            type_color = "cyan"
-            type_icon = "📁➖"
-        elif op_type == "group_delete":
-            type_color = "red"
-            type_icon = "📁✖️"
-        elif op_type == "group_import":
-            type_color = "blue"
-            type_icon = "📁📥"
-        elif op_type == "tag_add":
-            type_color = "magenta"
-            type_icon = "🏷️➕"
-        elif op_type == "tag_remove":
-            type_color = "magenta"
-            type_icon = "🏷️➖"
-        elif op_type == "tag_rename":
-            type_color = "yellow"
-            type_icon = "🏷️✏️"
-        elif op_type == "tag_delete":
-            type_color = "red"
-            type_icon = "🏷️✖️"
-        else:
-            type_color = "white"
-            type_icon = "🔧"
+        type_color, type_icon = OP_TYPE_STYLES.get(op_type, ("white", "🔧"))
 
         aliases_str = ", ".join(aliases[:3])  # Show max 3 aliases
         if len(aliases) > 3:
             aliases_str += f" ... (+{len(aliases) - 3} more)"
 
-        console.print(f"  [bold]{i}.[/] [{type_color}]{type_icon} {op_type.upper()}[/] {aliases_str}")
-        console.print(f"      [dim]at {formatted_time}[/]")
+        lines.append(f"  [bold]{i}.[/] [{type_color}]{type_icon} {op_type.upper()}[/] {aliases_str}")
+        lines.append(f"      [dim]at {formatted_time}[/]")
 
+    console.print("\n".join(lines))
     console.print(f"\n[dim]💡 Tip: Use 'alix undo --id 1' for most recent, 'alix undo --id {len(undo_ops)}' for oldest[/]")
 
 
@@ -608,71 +642,33 @@ def list_redo():
     console.print("[bold cyan]🔄 Redo History (most recent last):[/]")
     console.print(f"[dim]Use 'alix redo --id <number>' to redo a specific operation[/]")
 
+    # Collect every entry and print once; each console.print re-enters Rich's render pipeline
+    lines = []
     for i, op in enumerate(redo_ops, 1):
         op_type = op.get("type", "unknown")
         aliases = [a.get("name", "N/A") for a in op.get("aliases", [])]
         timestamp = op.get("timestamp", "N/A")
 
         # Format timestamp for better readability
-        try:
-            from datetime import datetime
-            dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-            formatted_time = dt.strftime("%Y-%m-%d %H:%M:%S")
-        except:
-            formatted_time = timestamp
+        formatted_time = _display_timestamp(timestamp)
 
         # Color code by operation type
-        if op_type == "add":
-            type_color = "green"
-            type_icon = "➕"
-        elif op_type == "remove":
-            type_color = "red"
-            type_icon = "➖"
-        elif op_type == "edit":
-            type_color = "yellow"
-            type_icon = "✏️"
-        elif op_type == "import":
-            type_color = "blue"
-            type_icon = "📥"
-        elif op_type == "group_add":
-            type_color = "cyan"
-            type_icon = "📁➕"
-        elif op_type == "group_remove":
-            type_color = "cyan"
-            type_icon = "📁➖"
-        elif op_type == "group_delete":
-            type_color = "red"
-            type_icon = "📁✖️"
-        elif op_type == "group_import":
-            type_color = "blue"
-            type_icon = "📁📥"
-        elif op_type == "tag_add":
-            type_color = "magenta"
-            type_icon = "🏷️➕"
-        elif op_type == "tag_remove":
-            type_color = "magenta"
-            type_icon = "🏷️➖"
-        elif op_type == "tag_rename":
-            type_color = "yellow"
-            type_icon = "🏷️✏️"
-        elif op_type == "tag_delete":
-            type_color = "red"
-            type_icon = "🏷️✖️"
-        else:
-            type_color = "white"
-            type_icon = "🔧"
+        type_color, type_icon = OP_TYPE_STYLES.get(op_type, ("white", "🔧"))
 
         aliases_str = ", ".join(aliases[:3])  # Show max 3 aliases
         if len(aliases) > 3:
             aliases_str += f" ... (+{len(aliases) - 3} more)"
 
-        console.print(f"  [bold]{i}.[/] [{type_color}]{type_icon} {op_type.upper()}[/] {aliases_str}")
-        console.print(f"      [dim]at {formatted_time}[/]")
+        lines.append(f"  [bold]{i}.[/] [{type_color}]{type_icon} {op_type.upper()}[/] {aliases_str}")
+        lines.append(f"      [dim]at {formatted_time}[/]")
 
+    console.print("\n".join(lines))
     console.print(f"\n[dim]💡 Tip: Use 'alix redo --id 1' for most recent, 'alix redo --id {len(redo_ops)}' for oldest[/]")
 
 
 @main.command()
+@click.option("--days", "-d", type=int, default=7, help="Number of days to show")
+@click.option("--alias", "-a", help="Show history for a specific alias")
 def history(days, alias):
     """Show usage history and trends"""
     if alias:
@@ -691,9 +687,7 @@ def history(days, alias):
         history = storage.usage_tracker.get_alias_usage_history(alias, days)
         if history:
             console.print(f"\n[bold]Recent Usage ({days} days):[/]")
-            for record in history[-10:]:  # Show last 10 records
-                date = datetime.fromisoformat(record["date"])
-                console.print(f"  {date.strftime('%Y-%m-%d %H:%M')}")
+            console.print("\n".join(f"  {record['display_date']}" for record in history[-10:]))  # Show last 10 records
         else:
             console.print("[dim]No usage history found[/]")
     else:
@@ -702,13 +696,12 @@ def history(days, alias):
         console.print(f"[bold cyan]📊 Overall Usage Trends ({days} days)[/]")
 
         if analytics["usage_trends"]:
-            recent_days = sorted(analytics["usage_trends"].items(), reverse=True)[:days]
+            recent_days = heapq.nlargest(days, analytics["usage_trends"].items(), key=itemgetter(0))
             total_recent_usage = sum(count for _, count in recent_days)
             console.print(f"Total usage in last {days} days: {total_recent_usage}")
 
             console.print(f"\n[bold]Daily Breakdown:[/]")
-            for date, count in recent_days:
-                console.print(f"  {date}: {count} uses")
+            console.print("\n".join(f"  {date}: {count} uses" for date, count in recent_days))
         else:
             console.print("[dim]No usage data available[/]")
 
@@ -720,6 +713,10 @@ def history(days, alias):
 @click.option("--output", "-o", type=click.Path(), help="Output path for standalone script")
 def setup_tracking(shell, file, standalone, output):
     """Set up automatic usage tracking for aliases"""
+    from alix.shell_detector import ShellType
+    from alix.shell_integrator import ShellIntegrator
+    from alix.shell_wrapper import ShellWrapper
+
     wrapper = ShellWrapper()
 
     # Determine shell type
@@ -732,7 +729,7 @@ def setup_tracking(shell, file, standalone, output):
             return
     else:
         # Auto-detect shell
-        from alix.shell_detector import ShellDetector, ShellType
+        from alix.shell_detector import ShellDetector
 
         detector = ShellDetector()
         shell_type = detector.detect_current_shell()
@@ -756,7 +753,7 @@ def setup_tracking(shell, file, standalone, output):
         if file:
             config_file = Path(file)
         else:
-            integrator = ShellIntegrator()
+            integrator = ShellIntegrator(storage)
             config_file = integrator.get_target_file()
 
         if not config_file or not config_file.exists():
@@ -771,11 +768,8 @@ def setup_tracking(shell, file, standalone, output):
             console.print(f"[red]✗[/] Failed to install tracking integration")
 
 
-@main.command()
-def about():
-    """About alix and quick help"""
-    about_text = f"""
-# 🚀 alix v{__version__}
+_ABOUT_TEXT = """
+# 🚀 alix v{version}
 
 **Interactive alias manager for your shell**
 
@@ -807,36 +801,77 @@ def about():
 
 ## Learn More
 GitHub: https://github.com/TheDevOpsBlueprint/alix-cli
-    """
-    console.print(Markdown(about_text))
+"""
+
+
+@functools.lru_cache(maxsize=1)
+def _about_markdown():
+    """Parse the about page once; its only variable part is the version"""
+    from rich.markdown import Markdown
+
+    return Markdown(_ABOUT_TEXT.format(version=__version__))
+
+
+@main.command()
+def about():
+    """About alix and quick help"""
+    console.print(_about_markdown())
 
 
 @main.command(name="list")
 def list_aliases():
     """List all aliases in a beautiful table"""
-    aliases = storage.list_all()
+    aliases = storage.list_sorted()
     if not aliases:
         console.print("[yellow]No aliases found.[/] Add one with 'alix add'")
         return
 
-    theme = config.get_theme()
-    table = Table(title=f"📋 Your Aliases ({len(aliases)} total)")
-    table.add_column("Name", style=theme["header_color"], no_wrap=True)
-    table.add_column("Command", style=theme["success_color"])
+    if not console.is_terminal:
+        # Piped output (e.g. 'alix list | grep'): skip Rich rendering and emit name<TAB>command lines
+        click.echo("\n".join(f"{alias.name}\t{alias.command}" for alias in aliases))
+        return
 
     if config.get("show_descriptions", True):
-        table.add_column("Description", style="dim")
-        table.add_column("Tags", style="yellow")
-        for alias in sorted(aliases, key=lambda a: a.name):
-            tags_str = ", ".join(alias.tags) if alias.tags else "—"
-            table.add_row(alias.name, alias.command, alias.description or "", tags_str)
+        headers = ("Name", "Command", "Description", "Tags")
+        rows = [
+            (alias.name, alias.command, alias.description or "", ", ".join(alias.tags) if alias.tags else "—")
+            for alias in aliases
+        ]
     else:
-        table.add_column("Tags", style="yellow")
-        for alias in sorted(aliases, key=lambda a: a.name):
-            tags_str = ", ".join(alias.tags) if alias.tags else "—"
-            table.add_row(alias.name, alias.command, tags_str)
+        headers = ("Name", "Command", "Tags")
+        rows = [
+            (alias.name, alias.command, ", ".join(alias.tags) if alias.tags else "—")
+            for alias in aliases
+        ]
+
+    title = f"📋 Your Aliases ({len(aliases)} total)"
+    if len(rows) > PLAIN_LIST_THRESHOLD:
+        # Rich measures every cell of a table; for very large collections print aligned plain text instead
+        console.print(title)
+        _print_plain_rows([headers, *rows])
+    else:
+        from rich.cells import cell_len
+        from rich.table import Table
+
+        theme = config.get_theme()
+        styles = {
+            "Name": theme["header_color"],
+            "Command": theme["success_color"],
+            "Description": "dim",
+            "Tags": "yellow",
+        }
+        # Names never wrap, so a fixed width (in terminal cells) spares Rich from measuring every name cell
+        name_width = max(cell_len(headers[0]), *(cell_len(row[0]) for row in rows))
+        table = Table(title=title)
+        for header in headers:
+            if header == "Name":
+                table.add_column(header, style=styles[header], no_wrap=True, width=name_width)
+            else:
+                table.add_column(header, style=styles[header])
+        for row in rows:
+            table.add_row(*row)
+        console.print(table)
 
-    console.print(table)
     console.print(f"\n[dim]💡 Tip: Run 'alix' for interactive mode![/]")
 
 
@@ -850,6 +885,8 @@ def group():
 @click.option("--name", "-n", prompt=True, help="Group name")
 def create(name):
     """Create a new group (shows existing aliases that can be assigned)"""
+    from rich.table import Table
+
     aliases = storage.list_all()
     ungrouped_aliases = [a for a in aliases if not a.group]
 
@@ -869,7 +906,7 @@ def create(name):
     for alias in ungrouped_aliases:
         table.add_row(
             alias.name,
-            alias.command[:50] + "..." if len(alias.command) > 50 else alias.command,
+            _truncate(alias.command, 50),
             alias.description or "—",
         )
 
@@ -877,37 +914,31 @@ def create(name):
     console.print(f"\n[dim]💡 Use 'alix group add {name} <alias_name>' to add aliases to this group[/]")
 
 
-@group.command()
-def list():
+@group.command(name="list")
+def list_groups():
     """List all groups and their aliases"""
-    aliases = storage.list_all()
-    groups = {}
-
-    # Group aliases by their group
-    for alias in aliases:
-        group_name = alias.group or "Ungrouped"
-        if group_name not in groups:
-            groups[group_name] = []
-        groups[group_name].append(alias)
+    from rich.table import Table
 
+    groups = list(storage.iter_groups())
     if not groups:
         console.print("[yellow]No groups found[/]")
         return
 
-    for group_name, group_aliases in sorted(groups.items()):
-        console.print(f"\n[bold cyan]📁 {group_name}[/] ({len(group_aliases)} aliases)")
+    for group_name, group_aliases in groups:
+        console.print(f"\n[bold cyan]📁 {group_name or 'Ungrouped'}[/] ({len(group_aliases)} aliases)")
+
+        rows = [(alias.name, _truncate(alias.command, 40), alias.description or "—") for alias in group_aliases]
+        if len(rows) > PLAIN_LIST_THRESHOLD:
+            _print_plain_rows([("Name", "Command", "Description"), *rows])
+            continue
 
         table = Table(show_header=True, header_style="bold magenta")
         table.add_column("Name", style="cyan", width=20)
         table.add_column("Command", style="white", width=40)
         table.add_column("Description", style="dim", width=30)
 
-        for alias in sorted(group_aliases, key=lambda a: a.name):
-            table.add_row(
-                alias.name,
-                alias.command[:40] + "..." if len(alias.command) > 40 else alias.command,
-                alias.description or "—",
-            )
+        for row in rows:
+            table.add_row(*row)
 
         console.print(table)
 
@@ -928,12 +959,10 @@ def add(group_name, alias_name):
 
     # Update the alias with the new group
     old_group = alias.group
-    alias.group = group_name
-    storage.aliases[alias_name] = alias
+    storage.set_group(alias_name, group_name)
     storage.save()
 
     # Record history for group_add operation
-    from alix.history_manager import HistoryManager
     history_op = {
         "type": "group_add",
         "aliases": [alias.to_dict()],
@@ -962,8 +991,7 @@ def remove(group_name, alias_name):
 
     # Remove the group from the alias
     old_group = alias.group
-    alias.group = None
-    storage.aliases[alias_name] = alias
+    storage.set_group(alias_name, None)
     storage.save()
 
     # Record history for group_remove operation
@@ -982,11 +1010,13 @@ def remove(group_name, alias_name):
 @group.command()
 @click.argument("group_name")
 @click.option("--reassign", help="Reassign aliases to this group instead of deleting")
-@click.confirmation_option(prompt="Are you sure you want to delete this group?")
-def delete(group_name, reassign):
+@click.option("--yes", "-y", is_flag=True, help="Skip the confirmation prompt")
+def delete(group_name, reassign, yes):
     """Delete a group and optionally reassign aliases"""
-    aliases = storage.list_all()
-    group_aliases = [a for a in aliases if a.group == group_name]
+    if not yes:
+        click.confirm("Are you sure you want to delete this group?", abort=True)
+
+    group_aliases = storage.get_by_group(group_name)
 
     if not group_aliases:
         console.print(f"[yellow]⚠[/] Group '{group_name}' not found or is empty")
@@ -998,9 +1028,7 @@ def delete(group_name, reassign):
         # Reassign to another group
         new_group = reassign
         for alias in group_aliases:
-            alias.group = new_group
-            storage.aliases[alias.name] = alias
-
+            storage.set_group(alias.name, new_group)
         storage.save()
 
         # Record history for group_delete with reassignment
@@ -1017,9 +1045,7 @@ def delete(group_name, reassign):
     else:
         # Remove group from aliases (set to None)
         for alias in group_aliases:
-            alias.group = None
-            storage.aliases[alias.name] = alias
-
+            storage.set_group(alias.name, None)
         storage.save()
 
         # Record history for group_delete
@@ -1040,16 +1066,17 @@ def delete(group_name, reassign):
 @click.option("--group", "-g", help="Import to specific group (overrides file group)")
 def import_group(file, group):
     """Import aliases from a group export file"""
+    from alix.models import Alias
+
     try:
-        with open(file, "r") as f:
-            data = json.load(f)
+        data = _read_json(file)
 
         if "aliases" not in data:
             console.print(f"[red]✗[/] Invalid group export file")
             return
 
         target_group = group or data.get("group", "imported")
-        imported_count = 0
+        new_aliases = []
         skipped_count = 0
 
         for alias_name, alias_data in data["aliases"].items():
@@ -1058,19 +1085,17 @@ def import_group(file, group):
                 continue
 
             alias = Alias.from_dict(alias_data)
-            old_group = alias.group
             alias.group = target_group
-            storage.aliases[alias_name] = alias
-            imported_count += 1
+            new_aliases.append(alias)
 
-        storage.save()
+        imported_count = len(new_aliases)
+        storage.bulk_update(new_aliases)
 
         # Record history for group import operation
-        imported_aliases = [storage.get(alias_name) for alias_name in [alias_name for alias_name, _ in data["aliases"].items() if alias_name not in storage.aliases or storage.aliases[alias_name].group != target_group]]
-        if imported_aliases:
+        if new_aliases:
             history_op = {
                 "type": "group_import",
-                "aliases": [alias.to_dict() for alias in imported_aliases],
+                "aliases": [alias.to_dict() for alias in new_aliases],
                 "group_name": target_group,
                 "timestamp": datetime.now().isoformat()
             }
@@ -1089,8 +1114,9 @@ def import_group(file, group):
 @click.option("--apply", is_flag=True, help="Apply all aliases in group to shell")
 def apply(group_name, apply):
     """Apply all aliases in a group to shell"""
-    aliases = storage.list_all()
-    group_aliases = [a for a in aliases if a.group == group_name]
+    from alix.shell_integrator import ShellIntegrator
+
+    group_aliases = storage.get_by_group(group_name)
 
     if not group_aliases:
         console.print(f"[yellow]⚠[/] Group '{group_name}' not found or is empty")
@@ -1098,23 +1124,26 @@ def apply(group_name, apply):
 
     console.print(f"[cyan]Applying {len(group_aliases)} aliases from group '{group_name}'[/]")
 
-    integrator = ShellIntegrator()
-    success_count = 0
+    integrator = ShellIntegrator(storage)
+    target_file = integrator.get_target_file()
 
-    for alias in group_aliases:
-        success, message = integrator.apply_single_alias(alias)
-        if success:
-            success_count += 1
-            console.print(f"[green]✔[/] Applied: {alias.name}")
-        else:
-            console.print(f"[red]✗[/] Failed: {alias.name} - {message}")
+    # Read and rewrite the shell config once for the whole group
+    try:
+        success, message = integrator.apply_aliases_batch(group_aliases, target_file=target_file)
+    except OSError as e:
+        success, message = False, str(e)
+    if success:
+        success_count = len(group_aliases)
+        console.print("\n".join(f"[green]✔[/] Applied: {alias.name}" for alias in group_aliases))
+    else:
+        # The whole group goes in one write, so a failure is reported once rather than per alias
+        success_count = 0
+        console.print(f"[red]✗[/] Failed to apply to {target_file or 'shell config'}: {message}")
 
     console.print(f"\n[bold]Summary:[/] {success_count}/{len(group_aliases)} aliases applied successfully")
 
     if success_count > 0:
-        target_file = integrator.get_target_file()
-        if target_file:
-            console.print(f"\n[dim]💡 Run 'source {target_file}' to activate in current session[/]")
+        console.print(f"\n[dim]💡 Run 'source {target_file}' to activate in current session[/]")
 
 
 @main.group()
@@ -1123,36 +1152,30 @@ def tag():
     pass
 
 
-@tag.command()
-def list():
+@tag.command(name="list")
+def list_tags():
     """List all tags and their usage"""
-    aliases = storage.list_all()
-    tag_counts = {}
+    from rich.table import Table
 
-    # Count aliases per tag
-    for alias in aliases:
-        for tag in alias.tags:
-            tag_counts[tag] = tag_counts.get(tag, 0) + 1
+    tagged_names = {tag: [alias.name for alias in aliases] for tag, aliases in storage.iter_tags()}
 
-    if not tag_counts:
+    if not tagged_names:
         console.print("[yellow]No tags found[/]")
         return
 
-    console.print(f"[bold cyan]📋 Tags ({len(tag_counts)} total)[/]")
+    console.print(f"[bold cyan]📋 Tags ({len(tagged_names)} total)[/]")
 
     table = Table(show_header=True, header_style="bold magenta")
     table.add_column("Tag", style="cyan", width=20)
     table.add_column("Count", style="yellow", width=10)
     table.add_column("Aliases", style="white", width=50)
 
-    for tag, count in sorted(tag_counts.items()):
-        # Get aliases with this tag
-        tagged_aliases = [a.name for a in aliases if tag in a.tags]
+    for tag, tagged_aliases in tagged_names.items():
         aliases_str = ", ".join(tagged_aliases[:5])  # Show first 5
         if len(tagged_aliases) > 5:
             aliases_str += f" ... (+{len(tagged_aliases) - 5} more)"
 
-        table.add_row(tag, str(count), aliases_str)
+        table.add_row(tag, str(len(tagged_aliases)), aliases_str)
 
     console.print(table)
 
@@ -1161,29 +1184,37 @@ def list():
 @click.argument("tag_name")
 def show(tag_name):
     """Show all aliases with a specific tag"""
-    aliases = storage.list_all()
-    tagged_aliases = [a for a in aliases if tag_name in a.tags]
+    from rich.table import Table
+
+    tagged_aliases = storage.get_by_tag(tag_name)
 
     if not tagged_aliases:
         console.print(f"[yellow]No aliases found with tag '{tag_name}'[/]")
         return
 
+    if not console.is_terminal:
+        # Piped output: skip Rich rendering and emit name<TAB>command lines
+        click.echo("\n".join(f"{alias.name}\t{alias.command}" for alias in tagged_aliases))
+        return
+
     console.print(f"[bold cyan]📋 Aliases with tag '{tag_name}' ({len(tagged_aliases)} total)[/]")
 
+    rows = [
+        (alias.name, _truncate(alias.command, 40), alias.description or "—", ", ".join(alias.tags) or "—")
+        for alias in tagged_aliases
+    ]
+    if len(rows) > PLAIN_LIST_THRESHOLD:
+        _print_plain_rows([("Name", "Command", "Description", "Tags"), *rows])
+        return
+
     table = Table(show_header=True, header_style="bold magenta")
     table.add_column("Name", style="cyan", width=20)
     table.add_column("Command", style="white", width=40)
     table.add_column("Description", style="dim", width=30)
     table.add_column("Tags", style="yellow", width=20)
 
-    for alias in sorted(tagged_aliases, key=lambda a: a.name):
-        tags_str = ", ".join(alias.tags) if alias.tags else "—"
-        table.add_row(
-            alias.name,
-            alias.command[:40] + "..." if len(alias.command) > 40 else alias.command,
-            alias.description or "—",
-            tags_str,
-        )
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
 
@@ -1199,16 +1230,12 @@ def add(alias_name, tags):
         return
 
     # Add new tags (avoid duplicates)
-    original_count = len(alias.tags)
-    original_tags = alias.tags.copy()
-    added_tags = []
-    for tag in tags:
-        if tag not in alias.tags:
-            alias.tags.append(tag)
-            added_tags.append(tag)
-
-    if len(alias.tags) > original_count:
-        storage.aliases[alias_name] = alias
+    current_tags = set(alias.tags)
+    added_tags = [tag for tag in dict.fromkeys(tags) if tag not in current_tags]
+    new_tags = alias.tags + added_tags
+
+    if added_tags:
+        storage.set_tags(alias_name, new_tags)
         storage.save()
 
         # Record history for tag_add operation
@@ -1220,9 +1247,8 @@ def add(alias_name, tags):
         }
         storage.history.push(history_op)
 
-        added_count = len(alias.tags) - original_count
-        console.print(f"[green]✓[/] Added {added_count} tag(s) to '{alias_name}'")
-        console.print(f"[dim]Current tags: {', '.join(alias.tags)}[/]")
+        console.print(f"[green]✓[/] Added {len(added_tags)} tag(s) to '{alias_name}'")
+        console.print(f"[dim]Current tags: {', '.join(new_tags)}[/]")
     else:
         console.print(f"[yellow]⚠[/] All specified tags already exist for '{alias_name}'")
 
@@ -1238,16 +1264,13 @@ def remove(alias_name, tags):
         return
 
     # Remove specified tags
-    original_count = len(alias.tags)
-    original_tags = alias.tags.copy()
-    removed_tags = []
-    for tag in tags:
-        if tag in alias.tags:
-            alias.tags.remove(tag)
-            removed_tags.append(tag)
-
-    if len(alias.tags) < original_count:
-        storage.aliases[alias_name] = alias
+    current_tags = set(alias.tags)
+    removed_tags = [tag for tag in dict.fromkeys(tags) if tag in current_tags]
+    dropped = set(removed_tags)
+    remaining_tags = [tag for tag in alias.tags if tag not in dropped]
+
+    if removed_tags:
+        storage.set_tags(alias_name, remaining_tags)
         storage.save()
 
         # Record history for tag_remove operation
@@ -1259,10 +1282,9 @@ def remove(alias_name, tags):
         }
         storage.history.push(history_op)
 
-        removed_count = original_count - len(alias.tags)
-        console.print(f"[green]✓[/] Removed {removed_count} tag(s) from '{alias_name}'")
-        if alias.tags:
-            console.print(f"[dim]Remaining tags: {', '.join(alias.tags)}[/]")
+        console.print(f"[green]✓[/] Removed {len(removed_tags)} tag(s) from '{alias_name}'")
+        if remaining_tags:
+            console.print(f"[dim]Remaining tags: {', '.join(remaining_tags)}[/]")
         else:
             console.print(f"[dim]No tags remaining[/]")
     else:
@@ -1273,10 +1295,10 @@ def remove(alias_name, tags):
 @click.argument("old_tag")
 @click.argument("new_tag")
 @click.option("--dry-run", is_flag=True, help="Show what would be changed without making changes")
-def rename(old_tag, new_tag, dry_run):
+@click.option("--yes", "-y", is_flag=True, help="Skip the confirmation prompt")
+def rename(old_tag, new_tag, dry_run, yes):
     """Rename a tag across all aliases"""
-    aliases = storage.list_all()
-    affected_aliases = [a for a in aliases if old_tag in a.tags]
+    affected_aliases = storage.get_by_tag(old_tag)
 
     if not affected_aliases:
         console.print(f"[yellow]No aliases found with tag '{old_tag}'[/]")
@@ -1291,43 +1313,37 @@ def rename(old_tag, new_tag, dry_run):
         return
 
     # Confirm the change
-    if not click.confirm(f"Rename tag '{old_tag}' to '{new_tag}' in {len(affected_aliases)} aliases?"):
+    if not yes and not click.confirm(f"Rename tag '{old_tag}' to '{new_tag}' in {len(affected_aliases)} aliases?"):
         return
 
-    # Perform the rename
-    updated_count = 0
+    # Perform the rename; every affected alias carries the old tag
     updated_aliases = []
     for alias in affected_aliases:
-        if old_tag in alias.tags:
-            # Replace old tag with new tag
-            alias.tags = [new_tag if tag == old_tag else tag for tag in alias.tags]
-            storage.aliases[alias.name] = alias
-            updated_aliases.append(alias.to_dict())
-            updated_count += 1
+        storage.set_tags(alias.name, [new_tag if tag == old_tag else tag for tag in alias.tags])
+        updated_aliases.append(alias.to_dict())
 
     storage.save()
 
     # Record history for tag_rename operation
-    if updated_aliases:
-        history_op = {
-            "type": "tag_rename",
-            "aliases": updated_aliases,
-            "old_tag": old_tag,
-            "new_tag": new_tag,
-            "timestamp": datetime.now().isoformat()
-        }
-        storage.history.push(history_op)
+    history_op = {
+        "type": "tag_rename",
+        "aliases": updated_aliases,
+        "old_tag": old_tag,
+        "new_tag": new_tag,
+        "timestamp": datetime.now().isoformat()
+    }
+    storage.history.push(history_op)
 
-    console.print(f"[green]✓[/] Renamed tag in {updated_count} aliases")
+    console.print(f"[green]✓[/] Renamed tag in {len(updated_aliases)} aliases")
 
 
 @tag.command()
 @click.argument("tag_name")
 @click.option("--dry-run", is_flag=True, help="Show what would be changed without making changes")
-def delete(tag_name, dry_run):
+@click.option("--yes", "-y", is_flag=True, help="Skip the confirmation prompt")
+def delete(tag_name, dry_run, yes):
     """Delete a tag from all aliases"""
-    aliases = storage.list_all()
-    affected_aliases = [a for a in aliases if tag_name in a.tags]
+    affected_aliases = storage.get_by_tag(tag_name)
 
     if not affected_aliases:
         console.print(f"[yellow]No aliases found with tag '{tag_name}'[/]")
@@ -1342,32 +1358,27 @@ def delete(tag_name, dry_run):
         return
 
     # Confirm the deletion
-    if not click.confirm(f"Remove tag '{tag_name}' from {len(affected_aliases)} aliases?"):
+    if not yes and not click.confirm(f"Remove tag '{tag_name}' from {len(affected_aliases)} aliases?"):
         return
 
-    # Remove the tag
-    updated_count = 0
+    # Remove the tag; every affected alias carries it
     updated_aliases = []
     for alias in affected_aliases:
-        if tag_name in alias.tags:
-            alias.tags.remove(tag_name)
-            storage.aliases[alias.name] = alias
-            updated_aliases.append(alias.to_dict())
-            updated_count += 1
+        storage.set_tags(alias.name, [tag for tag in alias.tags if tag != tag_name])
+        updated_aliases.append(alias.to_dict())
 
     storage.save()
 
     # Record history for tag_delete operation
-    if updated_aliases:
-        history_op = {
-            "type": "tag_delete",
-            "aliases": updated_aliases,
-            "deleted_tag": tag_name,
-            "timestamp": datetime.now().isoformat()
-        }
-        storage.history.push(history_op)
+    history_op = {
+        "type": "tag_delete",
+        "aliases": updated_aliases,
+        "deleted_tag": tag_name,
+        "timestamp": datetime.now().isoformat()
+    }
+    storage.history.push(history_op)
 
-    console.print(f"[green]✓[/] Removed tag from {updated_count} aliases")
+    console.print(f"[green]✓[/] Removed tag from {len(updated_aliases)} aliases")
 
 
 @tag.command()
@@ -1375,15 +1386,17 @@ def delete(tag_name, dry_run):
 @click.option("--tag", "-t", help="Import only aliases with specific tag")
 def import_tag(file, tag):
     """Import aliases from a file, optionally filtered by tag"""
+    from alix.models import Alias
+
     try:
-        with open(file, "r") as f:
-            data = json.load(f)
+        data = _read_json(file)
 
         if "aliases" not in data:
             console.print(f"[red]✗[/] Invalid export file")
             return
 
-        imported = 0
+        new_aliases = []
+        new_names = set()
         skipped = 0
         tag_filtered = 0
 
@@ -1395,15 +1408,16 @@ def import_tag(file, tag):
                 tag_filtered += 1
                 continue
 
-            if alias.name not in storage.aliases:
-                storage.aliases[alias.name] = alias
-                imported += 1
+            # Storage is only updated after the loop, so also skip names already collected from this file
+            if alias.name not in storage.aliases and alias.name not in new_names:
+                new_aliases.append(alias)
+                new_names.add(alias.name)
             else:
                 skipped += 1
 
-        storage.save()
+        storage.bulk_update(new_aliases)
 
-        console.print(f"[green]✓[/] Imported {imported} aliases")
+        console.print(f"[green]✓[/] Imported {len(new_aliases)} aliases")
         if skipped > 0:
             console.print(f"[yellow]⚠[/] Skipped {skipped} existing aliases")
         if tag_filtered > 0:
@@ -1419,16 +1433,17 @@ def import_tag(file, tag):
 @click.option("--format", type=click.Choice(["json", "yaml"]), default="json", help="Export format")
 def export(tag_name, file, format):
     """Export all aliases with a specific tag"""
-    aliases = storage.list_all()
-    tagged_aliases = [a for a in aliases if tag_name in a.tags]
+    tagged_aliases = storage.get_by_tag(tag_name)
 
     if not tagged_aliases:
         console.print(f"[yellow]No aliases found with tag '{tag_name}'[/]")
         return
 
+    now = datetime.now()
+
     # Generate filename if not provided
     if not file:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         file = f"alix_tag_{tag_name}_{timestamp}.{format}"
 
     filepath = Path(file)
@@ -1436,7 +1451,7 @@ def export(tag_name, file, format):
     # Export data
     export_data = {
         "version": "1.0",
-        "exported_at": datetime.now().isoformat(),
+        "exported_at": now.isoformat(),
         "tag": tag_name,
         "count": len(tagged_aliases),
         "aliases": [alias.to_dict() for alias in tagged_aliases],
@@ -1465,6 +1480,8 @@ def export(tag_name, file, format):
 @click.option("--match-all", is_flag=True, help="Match aliases that have ALL tags (default: match ANY)")
 def export_multi(tags, file, format, match_all):
     """Export aliases matching multiple tags"""
+    from alix.porter import AliasPorter
+
     if not file:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         match_type = "all" if match_all else "any"
@@ -1484,6 +1501,9 @@ def export_multi(tags, file, format, match_all):
 @tag.command()
 def stats():
     """Show comprehensive tag statistics"""
+    from rich.table import Table
+    from alix.porter import AliasPorter
+
     porter = AliasPorter()
     stats = porter.get_tag_statistics()
 
@@ -1500,7 +1520,7 @@ def stats():
         table.add_column("Count", style="yellow", width=10)
         table.add_column("Percentage", style="green", width=12)
 
-        for tag, count in list(stats["tag_counts"].items())[:10]:
+        for tag, count in heapq.nlargest(10, stats["tag_counts"].items(), key=itemgetter(1)):
             percentage = (count / stats["total_aliases"]) * 100
             table.add_row(tag, str(count), f"{percentage:.1f}%")
 
@@ -1512,7 +1532,7 @@ def stats():
         table.add_column("Tags", style="cyan", width=30)
         table.add_column("Count", style="yellow", width=10)
 
-        for combo, count in list(stats["tag_combinations"].items())[:10]:
+        for combo, count in heapq.nlargest(10, stats["tag_combinations"].items(), key=itemgetter(1)):
             tags_str = " + ".join(combo)
             table.add_row(tags_str, str(count))
 
@@ -1535,11 +1555,21 @@ def templates():
     pass
 
 
-@templates.command()
-def list():
+@templates.command(name="list")
+def list_templates():
     """List available templates"""
+    from rich.table import Table
+    from alix.template_manager import TemplateManager
+
     template_manager = TemplateManager()
 
+    if not console.is_terminal:
+        # Piped output: skip Rich rendering and emit name<TAB>category<TAB>description lines
+        all_templates = template_manager.list_templates()
+        if all_templates:
+            click.echo("\n".join(f"{t.name}\t{t.category}\t{t.description}" for t in all_templates))
+        return
+
     # Show categories first
     categories = template_manager.get_categories()
     if categories:
@@ -1567,7 +1597,7 @@ def list():
         table.add_row(
             template.name,
             template.category,
-            template.description[:40] + "..." if len(template.description) > 40 else template.description,
+            _truncate(template.description, 40),
             str(len(template.aliases)),
         )
 
@@ -1581,6 +1611,9 @@ def list():
 @click.option("--dry-run", is_flag=True, help="Show what would be imported without importing")
 def add_template(template_name, aliases, dry_run):
     """Import aliases from a template"""
+    from rich.table import Table
+    from alix.template_manager import TemplateManager
+
     template_manager = TemplateManager()
 
     template = template_manager.get_template(template_name)
@@ -1591,7 +1624,7 @@ def add_template(template_name, aliases, dry_run):
     # Parse alias filter if provided
     alias_names = None
     if aliases:
-        alias_names = [name.strip() for name in aliases.split(",") if name.strip()]
+        alias_names = [stripped for name in aliases.split(",") if (stripped := name.strip())]
 
     if dry_run:
         console.print(f"[bold cyan]📋 Preview: Would import from '{template_name}'[/]")
@@ -1606,6 +1639,10 @@ def add_template(template_name, aliases, dry_run):
             filtered_aliases = template.aliases
             console.print(f"\n[bold]All aliases ({len(filtered_aliases)}):[/]")
 
+        if not console.is_terminal:
+            click.echo("\n".join(f"{alias.name}\t{alias.command}" for alias in filtered_aliases))
+            return
+
         table = Table(show_header=True, header_style="bold magenta")
         table.add_column("Name", style="cyan", width=15)
         table.add_column("Command", style="white", width=40)
@@ -1616,7 +1653,7 @@ def add_template(template_name, aliases, dry_run):
             tags_str = ", ".join(alias.tags) if alias.tags else "—"
             table.add_row(
                 alias.name,
-                alias.command[:40] + "..." if len(alias.command) > 40 else alias.command,
+                _truncate(alias.command, 40),
                 alias.description or "—",
                 tags_str,
             )
@@ -1640,6 +1677,8 @@ def add_template(template_name, aliases, dry_run):
 @click.option("--dry-run", is_flag=True, help="Show what would be imported without importing")
 def add_category(category, aliases, dry_run):
     """Import all aliases from a category"""
+    from alix.template_manager import TemplateManager
+
     template_manager = TemplateManager()
 
     categories = template_manager.get_categories()
@@ -1651,7 +1690,7 @@ def add_category(category, aliases, dry_run):
     # Parse alias filter if provided
     alias_names = None
     if aliases:
-        alias_names = [name.strip() for name in aliases.split(",") if name.strip()]
+        alias_names = [stripped for name in aliases.split(",") if (stripped := name.strip())]
 
     if dry_run:
         templates = template_manager.list_templates(category)
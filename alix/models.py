@@ -48,6 +48,11 @@ class Alias:
     usage_history: List[UsageRecord] = field(default_factory=list)
     group: Optional[str] = None
 
+    @property
+    def chars_saved(self) -> int:
+        """Keystrokes saved by typing the alias instead of the command"""
+        return len(self.command) - len(self.name)
+
     def to_dict(self) -> dict:
         """Convert alias to dictionary for storage"""
         return {
@@ -2,6 +2,8 @@ import json
 import yaml
 from pathlib import Path
 from datetime import datetime
+from collections import Counter
+from itertools import combinations
 from typing import List, Dict, Any, Tuple
 
 from alix.models import Alias
@@ -102,14 +104,8 @@ class AliasPorter:
 
     def export_by_tags(self, tags: List[str], filepath: Path, format: str = "json", match_all: bool = False) -> Tuple[bool, str]:
         """Export aliases that match any (or all) of the specified tags"""
-        aliases = self.storage.list_all()
-
-        if match_all:
-            # Match aliases that have ALL specified tags
-            filtered_aliases = [alias for alias in aliases if all(tag in alias.tags for tag in tags)]
-        else:
-            # Match aliases that have ANY of the specified tags
-            filtered_aliases = [alias for alias in aliases if any(tag in alias.tags for tag in tags)]
+        # Intersect (ALL) or union (ANY) the tag index buckets instead of testing every alias
+        filtered_aliases = self.storage.get_by_tags(tags, match_all)
 
         if not filtered_aliases:
             return False, f"No aliases found matching tags: {', '.join(tags)}"
@@ -140,26 +136,19 @@ class AliasPorter:
     def get_tag_statistics(self) -> Dict[str, Any]:
         """Get comprehensive tag statistics"""
         aliases = self.storage.list_all()
-        tag_counts = {}
-        tag_combinations = {}
+        tag_counts: Counter = Counter()
+        tag_combinations: Counter = Counter()
 
         for alias in aliases:
-            # Count individual tags
-            for tag in alias.tags:
-                tag_counts[tag] = tag_counts.get(tag, 0) + 1
-
-            # Count tag combinations (pairs)
-            if len(alias.tags) >= 2:
-                for i, tag1 in enumerate(alias.tags):
-                    for tag2 in alias.tags[i+1:]:
-                        combo = tuple(sorted([tag1, tag2]))
-                        tag_combinations[combo] = tag_combinations.get(combo, 0) + 1
+            # Count individual tags and tag combinations (pairs)
+            tag_counts.update(alias.tags)
+            tag_combinations.update(tuple(sorted(pair)) for pair in combinations(alias.tags, 2))
 
         return {
             "total_tags": len(tag_counts),
             "total_aliases": len(aliases),
             "tagged_aliases": len([a for a in aliases if a.tags]),
             "untagged_aliases": len([a for a in aliases if not a.tags]),
-            "tag_counts": dict(sorted(tag_counts.items(), key=lambda x: x[1], reverse=True)),
-            "tag_combinations": dict(sorted(tag_combinations.items(), key=lambda x: x[1], reverse=True))
+            "tag_counts": dict(tag_counts.most_common()),
+            "tag_combinations": dict(tag_combinations.most_common())
         }
@@ -26,9 +26,9 @@ class Render:
         out = Text(justify="left")
         for tag, i1, i2, j1, j2 in sm.get_opcodes():
             if tag == "equal":
+                # Unstyled runs carry no spans, so append them as one string
                 tokens = left_tokens[i1:i2] if side == "left" else right_tokens[j1:j2]
-                for t in tokens:
-                    out.append(t)
+                out.append("".join(tokens))
             elif tag == "replace":
                 tokens = left_tokens[i1:i2] if side == "left" else right_tokens[j1:j2]
                 color = "red" if side == "left" else "green"
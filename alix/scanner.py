@@ -1,9 +1,10 @@
 """Scanner for existing system aliases"""
 
 import re
+import shutil
 import subprocess
 from pathlib import Path
-from typing import List, Dict
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from alix.models import Alias
 from alix.shell_detector import ShellDetector, ShellType
@@ -45,18 +46,31 @@ class AliasScanner:
 
         return aliases
 
-    def scan_system(self) -> Dict[str, List[Alias]]:
-        """Scan all shell config files for aliases"""
+    def iter_scan_system(self) -> Iterator[Tuple[str, List[Alias]]]:
+        """Yield (filename, aliases) for each shell config file as soon as it is scanned"""
         shell_type = self.detector.detect_current_shell()
         config_files = self.detector.find_config_files(shell_type)
 
-        results = {}
         for filename, filepath in config_files.items():
             aliases = self.scan_file(filepath)
             if aliases:  # pragma: no branch
-                results[filename] = aliases
+                yield filename, aliases
 
-        return results
+    def scan_system(self) -> Dict[str, List[Alias]]:
+        """Scan all shell config files for aliases"""
+        return dict(self.iter_scan_system())
+
+    def find_existing_command(self, name: str) -> Optional[str]:
+        """Describe the PATH executable or shell config alias already called name, or None"""
+        # Read PATH and the config files directly rather than starting an interactive shell to ask it
+        path = shutil.which(name)
+        if path:
+            return path
+        for filename, aliases in self.iter_scan_system():
+            for alias in aliases:
+                if alias.name == name:
+                    return f"{name}: aliased to {alias.command} (in {filename})"
+        return None
 
     def get_active_aliases(self) -> List[Alias]:
         """Get currently active aliases using shell command"""
@@ -1,7 +1,7 @@
 import shutil
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from alix.shell_detector import ShellDetector, ShellType
 from alix.storage import AliasStorage
@@ -15,13 +15,27 @@ class ShellIntegrator:
     ALIX_COMPLETION_MARKER_START = "# === ALIX MANAGED COMPLETIONS START ==="
     ALIX_COMPLETION_MARKER_END = "# === ALIX MANAGED COMPLETIONS END ==="
 
-    def __init__(self):
+    def __init__(self, storage: Optional[AliasStorage] = None):
         self.detector = ShellDetector()
-        self.storage = AliasStorage()
+        # Callers that already loaded the aliases pass their storage in to avoid parsing the file again
+        self.storage = storage if storage is not None else AliasStorage()
         self.shell_type = self.detector.detect_current_shell()
+        self._target_files: Dict[ShellType, Path] = {}
 
     def get_target_file(self) -> Optional[Path]:
         """Get the appropriate shell config file to modify"""
+        # Applying then reloading asks again; reuse the lookup instead of re-statting every config file
+        cached = self._target_files.get(self.shell_type)
+        if cached is not None:
+            return cached
+
+        target_file = self._find_target_file()
+        if target_file is not None:
+            self._target_files[self.shell_type] = target_file
+        return target_file
+
+    def _find_target_file(self) -> Optional[Path]:
+        """Pick the highest-priority existing config file for the shell type"""
         configs = self.detector.find_config_files(self.shell_type)
 
         # Priority order for different shells
@@ -136,45 +150,71 @@ class ShellIntegrator:
 
     # NEW METHOD: apply_single_alias
     def apply_single_alias(
-        self, alias: Alias, auto_reload: bool = True
+        self, alias: Alias, auto_reload: bool = True, target_file: Optional[Path] = None
     ) -> Tuple[bool, str]:
         """Apply a single alias immediately to the current shell session"""
-        target_file = self.get_target_file()
+        if target_file is None:
+            target_file = self.get_target_file()
 
         if not target_file:
             return False, "No shell configuration file found"
 
+        self._add_alias_lines(target_file, [alias])
+
+        if auto_reload:
+            self.reload_shell_config()
+
+        return True, f"Applied alias '{alias.name}' to {target_file.name}"
+
+    def apply_aliases_batch(
+        self, aliases: List[Alias], auto_reload: bool = True, target_file: Optional[Path] = None
+    ) -> Tuple[bool, str]:
+        """Apply several aliases with one read and one write of the shell config"""
+        if target_file is None:
+            target_file = self.get_target_file()
+
+        if not target_file:
+            return False, "No shell configuration file found"
+
+        self._add_alias_lines(target_file, aliases)
+
+        if auto_reload:
+            self.reload_shell_config()
+
+        return True, f"Applied {len(aliases)} aliases to {target_file.name}"
+
+    def _add_alias_lines(self, target_file: Path, aliases: List[Alias]) -> None:
+        """Add alias lines missing from the alix section of target_file, creating the section if needed"""
         # Read current config
         content = target_file.read_text()
 
         # Check if alix section exists
         start_idx = content.find(self.ALIX_MARKER_START)
         end_idx = content.find(self.ALIX_MARKER_END)
+        has_section = start_idx != -1 and end_idx != -1
+        section_content = content[start_idx:end_idx] if has_section else ""
 
-        alias_line = f"alias {alias.name}='{alias.command}'"
+        # First definition of each name wins, as when aliases are applied one at a time
+        alias_lines = {}
+        for alias in aliases:
+            if alias.name not in alias_lines and f"alias {alias.name}=" not in section_content:
+                alias_lines[alias.name] = f"alias {alias.name}='{alias.command}'\n"
 
-        if start_idx != -1 and end_idx != -1:
-            # Insert into existing alix section
-            section_content = content[start_idx:end_idx]
-            if f"alias {alias.name}=" not in section_content:
+        if has_section:
+            if alias_lines:
                 # Add before the end marker
-                new_content = content[:end_idx] + f"{alias_line}\n" + content[end_idx:]
+                new_content = content[:end_idx] + "".join(alias_lines.values()) + content[end_idx:]
                 target_file.write_text(new_content)
         else:
             # Create new alix section
             aliases_section = f"\n{self.ALIX_MARKER_START}\n"
             aliases_section += f"# Generated by alix on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-            aliases_section += f"{alias_line}\n"
+            aliases_section += "".join(alias_lines.values())
             aliases_section += f"{self.ALIX_MARKER_END}\n"
 
             content = content.rstrip() + aliases_section
             target_file.write_text(content)
 
-        if auto_reload:
-            self.reload_shell_config()
-
-        return True, f"Applied alias '{alias.name}' to {target_file.name}"
-
     # NEW METHOD: reload_shell_config
     def reload_shell_config(self) -> bool:
         """Attempt to reload shell configuration"""
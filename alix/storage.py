@@ -1,13 +1,66 @@
 import json
+import os
 import shutil
+from collections import Counter
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
 from datetime import datetime
 
 from alix.models import Alias, TEST_ALIAS_NAME
 from alix.usage_tracker import UsageTracker
 from alix.history_manager import HistoryManager
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class _AliasMap(dict):
+    """Alias dict that reports every change to its contents, so derived views and indexes never go stale"""
+
+    def __init__(self, aliases: Dict[str, Alias], storage: "AliasStorage") -> None:
+        super().__init__(aliases)
+        self._storage = storage
+
+    def __setitem__(self, name: str, alias: Alias) -> None:
+        super().__setitem__(name, alias)
+        self._storage._alias_changed(name)
+
+    def __delitem__(self, name: str) -> None:
+        super().__delitem__(name)
+        self._storage._alias_changed(name)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def pop(self, name: str, *default):
+        if name not in self:
+            return super().pop(name, *default)
+        result = super().pop(name)
+        self._storage._alias_changed(name)
+        return result
+
+    def popitem(self):
+        name, alias = super().popitem()
+        self._storage._alias_changed(name)
+        return name, alias
+
+    def setdefault(self, name: str, default: Optional[Alias] = None):
+        if name not in self:
+            self[name] = default
+        return self[name]
+
+    def update(self, *args, **kwargs) -> None:
+        for name, alias in dict(*args, **kwargs).items():
+            self[name] = alias
+
+    def clear(self) -> None:
+        super().clear()
+        self._storage._invalidate_views()
+
 
 class AliasStorage:
     """Handle storage and retrieval of aliases"""
@@ -26,11 +79,91 @@ class AliasStorage:
         self.backup_dir = self.storage_path.parent / "backups"
         self.backup_dir.mkdir(exist_ok=True)
 
-        self.aliases: Dict[str, Alias] = {}
+        self._sorted_aliases: Optional[Tuple[Alias, ...]] = None
+        # group -> alias names (ungrouped aliases under None) and tag -> alias names; built on first use,
+        # then kept current. The _indexed_* maps record where each name was filed, for moving it later.
+        self._group_index: Optional[Dict[Optional[str], Set[str]]] = None
+        self._tag_index: Dict[str, Set[str]] = {}
+        self._indexed_groups: Dict[str, Optional[str]] = {}
+        self._indexed_tags: Dict[str, FrozenSet[str]] = {}
+        self.aliases = {}
+        self._backup_count: Optional[int] = None
+        self._last_backup: Optional[Path] = None
         self.usage_tracker = UsageTracker(self.storage_dir)
         self.history = HistoryManager(self.storage_dir / "history.json")
         self.load()
 
+    @property
+    def aliases(self) -> Dict[str, Alias]:
+        """All aliases keyed by name"""
+        return self._aliases
+
+    @aliases.setter
+    def aliases(self, aliases: Dict[str, Alias]) -> None:
+        self._aliases = _AliasMap(aliases, self)
+        self._invalidate_views()
+
+    def _invalidate_views(self) -> None:
+        """Drop the cached ordering and indexes derived from the aliases"""
+        self._sorted_aliases = None
+        self._group_index = None
+        self._tag_index = {}
+        self._indexed_groups = {}
+        self._indexed_tags = {}
+
+    def _alias_changed(self, name: str) -> None:
+        """Bring the cached views up to date after the alias stored under name was set or removed"""
+        self._sorted_aliases = None
+        self._reindex(name)
+
+    def _reindex(self, name: str) -> None:
+        """Move name to the index buckets matching the alias currently stored under it"""
+        if self._group_index is None:
+            return
+        # Drop the entries recorded when the name was last indexed; the alias may have been edited since
+        if name in self._indexed_groups:
+            self._unfile(self._group_index, self._indexed_groups.pop(name), name)
+            for tag in self._indexed_tags.pop(name):
+                self._unfile(self._tag_index, tag, name)
+        alias = self._aliases.get(name)
+        if alias is not None:
+            self._index(name, alias)
+
+    @staticmethod
+    def _unfile(index: Dict, key: Optional[str], name: str) -> None:
+        names = index[key]
+        names.discard(name)
+        if not names:
+            del index[key]
+
+    def _index(self, name: str, alias: Alias) -> None:
+        group = alias.group or None
+        tags = frozenset(alias.tags)
+        self._group_index.setdefault(group, set()).add(name)
+        for tag in tags:
+            self._tag_index.setdefault(tag, set()).add(name)
+        self._indexed_groups[name] = group
+        self._indexed_tags[name] = tags
+
+    def _build_indexes(self) -> None:
+        """Build the group and tag indexes in one pass over the aliases the first time they are needed"""
+        if self._group_index is None:
+            self._group_index = {}
+            for name, alias in self._aliases.items():
+                self._index(name, alias)
+
+    def _groups_index(self) -> Dict[Optional[str], Set[str]]:
+        self._build_indexes()
+        return self._group_index
+
+    def _tags_index(self) -> Dict[str, Set[str]]:
+        self._build_indexes()
+        return self._tag_index
+
+    def _named(self, names: Iterable[str]) -> List[Alias]:
+        """The aliases stored under names, sorted by name"""
+        return sorted((self._aliases[name] for name in names), key=attrgetter("name"))
+
     def create_backup(self) -> Optional[Path]:
         """Create timestamped backup of current aliases"""
         if not self.storage_path.exists() or not self.aliases:
@@ -38,11 +171,16 @@ class AliasStorage:
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_path = self.backup_dir / f"aliases_{timestamp}.json"
+        # Changes within the same second share a backup name: keep the first copy, which holds the
+        # state before the burst, instead of overwriting it and re-pruning on every change
+        if backup_path == self._last_backup:
+            return backup_path
 
         try:
             shutil.copy2(self.storage_path, backup_path)
             # Keep only last 10 backups
             self.cleanup_old_backups(keep=10)
+            self._last_backup = backup_path
             return backup_path
         except Exception:  # pragma: no cover
             return None
@@ -53,17 +191,29 @@ class AliasStorage:
         if len(backups) > keep:  # pragma: no branch
             for backup in backups[:-keep]:
                 backup.unlink()
+        self._backup_count = min(len(backups), keep)
+
+    @property
+    def backup_count(self) -> int:
+        """Number of backups on disk, listed once and then kept up to date"""
+        if self._backup_count is None:
+            self._backup_count = sum(
+                1 for name in os.listdir(self.backup_dir) if name.startswith("aliases_") and name.endswith(".json")
+            )
+        return self._backup_count
 
     def load(self) -> None:
         """Load aliases from JSON file"""
         if self.storage_path.exists():
             try:
-                with open(self.storage_path, "r") as f:
-                    data = json.load(f)
-                    self.aliases = {
-                        name: Alias.from_dict(alias_data)
-                        for name, alias_data in data.items()
-                    }
+                with open(self.storage_path, "rb") as f:
+                    raw = f.read()
+                # Every command starts by loading the file, so parse with orjson when it is installed
+                data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                self.aliases = {
+                    name: Alias.from_dict(alias_data)
+                    for name, alias_data in data.items()
+                }
             except (json.JSONDecodeError, Exception):
                 # If file is corrupted, start fresh but backup old file
                 backup_path = self.storage_path.with_suffix(".corrupted")
@@ -78,8 +228,11 @@ class AliasStorage:
 
         data = {name: alias.to_dict() for name, alias in self.aliases.items()}
 
-        with open(self.storage_path, "w") as f:
+        # Write to a temporary file first so a failed write never truncates the real one
+        tmp_path = self.storage_path.with_name(self.storage_path.name + ".tmp")
+        with open(tmp_path, "w") as f:
             json.dump(data, f, indent=2, default=str)
+        os.replace(tmp_path, self.storage_path)
 
     def add(self, alias: Alias, record_history: bool = True) -> bool:
         """Add a new alias, return True if successful"""
@@ -92,6 +245,52 @@ class AliasStorage:
             self.history.push({"type": "add", "aliases": [alias.to_dict()]})
         return True
 
+    def add_many(
+        self, aliases: Iterable[Alias], skip_existing: bool = True, record_history: bool = True
+    ) -> Tuple[List[Alias], int]:
+        """Add several aliases with a single backup and save, return (added aliases, skipped count)"""
+        added: Dict[str, Alias] = {}
+        replaced: List[Alias] = []
+        skipped = 0
+        # Snapshot the names present before the batch so only their originals are recorded as replaced
+        existing = frozenset(self.aliases)
+        for alias in aliases:
+            if alias.name in existing or alias.name in added:
+                # A name repeated within the batch counts as existing too: the first one is kept
+                if skip_existing:
+                    skipped += 1
+                    continue
+                if alias.name not in added:
+                    replaced.append(self.aliases[alias.name])
+            if not added:
+                self.create_backup()  # Backup before the first modification
+            self.aliases[alias.name] = alias
+            added[alias.name] = alias
+
+        if added:
+            self.save()
+            if record_history:
+                if replaced:
+                    self.history.push({"type": "remove", "aliases": [a.to_dict() for a in replaced]})
+                self.history.push({"type": "import", "aliases": [a.to_dict() for a in added.values()]})
+        return list(added.values()), skipped
+
+    def update(self, alias: Alias) -> bool:
+        """Replace an existing alias with a single backup and save, return True if it existed"""
+        if alias.name not in self.aliases:
+            return False
+        self.create_backup()  # Backup before modification
+        self.aliases[alias.name] = alias
+        self.save()
+        return True
+
+    def bulk_update(self, updates: Iterable[Alias] = (), removals: Iterable[str] = ()) -> None:
+        """Apply several alias changes in memory and persist them with a single write"""
+        self.aliases.update((alias.name, alias) for alias in updates)
+        for name in removals:
+            self.aliases.pop(name, None)
+        self.save()
+
     def remove(self, name: str, record_history: bool = True) -> bool:
         """Remove an alias, return True if it existed"""
         if name in self.aliases:
@@ -112,6 +311,16 @@ class AliasStorage:
         """Get all aliases as a list"""
         return list(self.aliases.values())
 
+    def count(self) -> int:
+        """Get the number of aliases without copying them"""
+        return len(self.aliases)
+
+    def list_sorted(self) -> Tuple[Alias, ...]:
+        """Get all aliases sorted by name, reusing the sort until the aliases change"""
+        if self._sorted_aliases is None:
+            self._sorted_aliases = tuple(sorted(self.aliases.values(), key=attrgetter("name")))
+        return self._sorted_aliases
+
     def clear_test_alias(self) -> None:
         """Remove test alias if it exists (for safe testing)"""
         self.remove(TEST_ALIAS_NAME)
@@ -126,20 +335,23 @@ class AliasStorage:
             return True
         return False
 
-    def track_usage(self, alias_name: str, context: Optional[str] = None) -> None:
-        """Track usage of an alias"""
-        if alias_name in self.aliases:
+    def track_usage(self, alias_name: str, context: Optional[str] = None) -> Optional[Alias]:
+        """Track usage of an alias, returning the updated alias if it exists"""
+        alias = self.aliases.get(alias_name)
+        if alias:
             # Update the alias object
-            self.aliases[alias_name].record_usage(context)
+            alias.record_usage(context)
             self.save()
 
             # Update the usage tracker
             self.usage_tracker.track_alias_usage(alias_name, context)
+        return alias
 
-    def get_usage_analytics(self) -> Dict:
-        """Get comprehensive usage analytics"""
-        aliases = list(self.aliases.values())
-        analytics = self.usage_tracker.get_usage_analytics(aliases)
+    def get_usage_analytics(self, aliases: Optional[List[Alias]] = None, top_k: int = 10) -> Dict:
+        """Get comprehensive usage analytics, optionally for an alias list the caller already holds"""
+        if aliases is None:
+            aliases = list(self.aliases.values())
+        analytics = self.usage_tracker.get_usage_analytics(aliases, top_k=top_k)
 
         return {
             "total_aliases": analytics.total_aliases,
@@ -153,21 +365,31 @@ class AliasStorage:
             "most_productive_aliases": analytics.most_productive_aliases
         }
 
-    def get_by_group(self, group_name: str) -> List[Alias]:
-        """Get all aliases in a specific group"""
-        return [alias for alias in self.aliases.values() if alias.group == group_name]
+    def set_group(self, name: str, group: Optional[str]) -> Optional[Alias]:
+        """Move an alias to a group (None to ungroup), keeping the group index current"""
+        alias = self.aliases.get(name)
+        if alias is not None:
+            alias.group = group
+            self._reindex(name)
+        return alias
+
+    def get_by_group(self, group_name: Optional[str]) -> List[Alias]:
+        """Get all aliases in a specific group, or the ungrouped ones for None"""
+        return self._named(self._groups_index().get(group_name or None, ()))
 
     def get_groups(self) -> List[str]:
         """Get all unique group names"""
-        groups = set()
-        for alias in self.aliases.values():
-            if alias.group:
-                groups.add(alias.group)
-        return sorted(list(groups))
+        return sorted(group for group in self._groups_index() if group is not None)
+
+    def iter_groups(self) -> Iterator[Tuple[Optional[str], List[Alias]]]:
+        """Yield (group, aliases) sorted by display name and alias name, with ungrouped aliases under None"""
+        index = self._groups_index()
+        groups = sorted(index, key=lambda group: group or "Ungrouped")
+        yield from [(group, self._named(index[group])) for group in groups]
 
     def remove_group(self, group_name: str) -> int:
         """Remove all aliases in a group, return count of removed aliases"""
-        aliases_to_remove = [name for name, alias in self.aliases.items() if alias.group == group_name]
+        aliases_to_remove = [alias.name for alias in self.get_by_group(group_name)]
         if not aliases_to_remove:
             return 0
 
@@ -184,22 +406,37 @@ class AliasStorage:
 
         return count
 
+    def set_tags(self, name: str, tags: Iterable[str]) -> Optional[Alias]:
+        """Replace the tags of an alias, keeping the tag index current"""
+        alias = self.aliases.get(name)
+        if alias is not None:
+            alias.tags = list(tags)
+            self._reindex(name)
+        return alias
+
     def get_by_tag(self, tag_name: str) -> List[Alias]:
         """Get all aliases with a specific tag"""
-        return [alias for alias in self.aliases.values() if tag_name in alias.tags]
+        return self._named(self._tags_index().get(tag_name, ()))
+
+    def get_by_tags(self, tags: Iterable[str], match_all: bool = False) -> List[Alias]:
+        """Get the aliases carrying all (match_all) or any of the given tags, sorted by name"""
+        index = self._tags_index()
+        buckets = [index.get(tag, set()) for tag in tags]
+        if not buckets:
+            return []
+        names = set.intersection(*buckets) if match_all else set().union(*buckets)
+        return self._named(names)
 
     def get_tags(self) -> List[str]:
         """Get all unique tag names"""
-        tags = set()
-        for alias in self.aliases.values():
-            tags.update(alias.tags)
-        return sorted(list(tags))
+        return sorted(self._tags_index())
+
+    def iter_tags(self) -> Iterator[Tuple[str, List[Alias]]]:
+        """Yield (tag, aliases) sorted by tag and alias name"""
+        index = self._tags_index()
+        yield from [(tag, self._named(index[tag])) for tag in sorted(index)]
 
     def get_tag_counts(self) -> Dict[str, int]:
         """Get count of aliases per tag"""
-        tag_counts = {}
-        for alias in self.aliases.values():
-            for tag in alias.tags:
-                tag_counts[tag] = tag_counts.get(tag, 0) + 1
-        return tag_counts
+        return Counter({tag: len(names) for tag, names in self._tags_index().items()})
 
@@ -1,5 +1,6 @@
 import yaml
 from pathlib import Path
+from operator import attrgetter
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 
@@ -97,7 +98,7 @@ class TemplateManager:
         if category:
             templates = [t for t in templates if t.category == category]
 
-        return sorted(templates, key=lambda t: t.name)
+        return sorted(templates, key=attrgetter("name"))
 
     def get_template(self, name: str) -> Optional[Template]:
         """Get a specific template by name"""
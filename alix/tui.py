@@ -1,4 +1,4 @@
-import subprocess
+from operator import attrgetter, itemgetter
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical, Center, VerticalScroll
 from textual.widgets import (
@@ -20,6 +20,7 @@ from alix import __version__
 from alix.storage import AliasStorage
 from alix.models import Alias
 from alix.config import Config
+from alix.scanner import AliasScanner
 from alix.shell_integrator import ShellIntegrator  # NEW IMPORT
 from alix.clipboard import ClipboardManager
 
@@ -137,7 +138,7 @@ class AddAliasModal(ModalScreen[bool]):
             # Parse tags
             tags = []
             if tags_input:
-                tags = [tag.strip() for tag in tags_input.split(",") if tag.strip()]
+                tags = [stripped for tag in tags_input.split(",") if (stripped := tag.strip())]
 
             if name and command:
                 storage = AliasStorage()
@@ -148,22 +149,12 @@ class AddAliasModal(ModalScreen[bool]):
                     command_exists = True
                     msg = f"Alias '{name}' exists in alix\nEdit the alias to override"
                 if not command_exists:
-                    cmd = subprocess.run(
-                        [
-                            "bash",
-                            "-i",
-                            "-c",
-                            f"(alias; declare -f) | /usr/bin/which --tty-only --read-alias --read-functions --show-tilde --show-dot {name}",
-                        ],
-                        capture_output=True,
-                        text=True,
-                        timeout=5,
-                    )
-                    if cmd.returncode == 0:
+                    existing = AliasScanner().find_existing_command(name)
+                    if existing is not None:
                         command_exists = True
                         msg = (
                             "Alias/Command/Function already exists\nEnable Force Override if you want to override this alias\n"
-                            + cmd.stdout
+                            + existing
                         )
                 if command_exists and not force:
                     self.app.notify(
@@ -174,7 +165,7 @@ class AddAliasModal(ModalScreen[bool]):
                     alias = Alias(name=name, command=command, description=desc or None, tags=tags)
                     if storage.add(alias):
                         # Auto-apply the alias
-                        integrator = ShellIntegrator()
+                        integrator = ShellIntegrator(storage)
                         success, message = integrator.apply_single_alias(alias)
 
                         if success:
@@ -323,7 +314,7 @@ class EditAliasModal(ModalScreen[bool]):
                 storage.save()
 
                 # Auto-apply the updated alias
-                integrator = ShellIntegrator()
+                integrator = ShellIntegrator(storage)
                 integrator.apply_single_alias(updated)
 
                 self.dismiss(True)
@@ -686,15 +677,15 @@ class AliasManager(App):
         table = self.query_one("#table", DataTable)
         table.clear()
 
-        aliases = sorted(self.storage.list_all(), key=lambda a: a.name)
-
-        # Apply group filter
+        # Apply group filter straight from the storage's group index
         current_group_filter = getattr(self, '_current_group_filter', None)
         if current_group_filter and current_group_filter not in ["All Groups"]:
             if current_group_filter == "Ungrouped":
-                aliases = [a for a in aliases if not a.group]
+                aliases = self.storage.get_by_group(None)
             else:
-                aliases = [a for a in aliases if a.group == current_group_filter]
+                aliases = self.storage.get_by_group(current_group_filter)
+        else:
+            aliases = sorted(self.storage.list_all(), key=attrgetter("name"))
 
         # Apply tag filter
         current_tag_filter = getattr(self, '_current_tag_filter', None)
@@ -732,7 +723,7 @@ class AliasManager(App):
                         results.append((alias, max_score))
 
                 # Sort by score (highest first)
-                results.sort(key=lambda x: x[1], reverse=True)
+                results.sort(key=itemgetter(1), reverse=True)
                 aliases = [alias for alias, score in results]
             else:
                 # Original exact substring search
@@ -761,7 +752,7 @@ class AliasManager(App):
 
     def update_status(self, shown: int = None) -> None:
         status = self.query_one("#status-bar", Static)
-        total = len(self.storage.list_all())
+        total = self.storage.count()
 
         # Add fuzzy search indicator
         fuzzy_status = (
@@ -880,7 +871,7 @@ class AliasManager(App):
                             "Select an alias"
                         )
                         # Reapply all to remove deleted alias from shell
-                        integrator = ShellIntegrator()
+                        integrator = ShellIntegrator(self.storage)
                         integrator.apply_aliases()
                     else:
                         self.notify("Failed to delete alias", severity="error")
@@ -929,7 +920,7 @@ class AliasManager(App):
     # NEW METHOD: Apply all aliases to shell
     def action_apply_all(self) -> None:
         """Apply all aliases to shell configuration"""
-        integrator = ShellIntegrator()
+        integrator = ShellIntegrator(self.storage)
         target_file = integrator.get_target_file()
 
         if not target_file:
@@ -961,22 +952,14 @@ class AliasManager(App):
     
     def action_filter_by_group(self) -> None:
         """Filter aliases by group"""
-        aliases = self.storage.list_all()
-        groups = set()
-        
-        # Collect all unique groups
-        for alias in aliases:
-            if alias.group:
-                groups.add(alias.group)
+        groups = self.storage.get_groups()
         
         if not groups:
             self.notify("No groups found. Create some aliases with groups first.", severity="warning")
             return
         
         # Create a simple group selection dialog
-        groups_list = sorted(list(groups))
-        groups_list.insert(0, "All Groups")  # Add option to show all
-        groups_list.append("Ungrouped")      # Add option to show ungrouped
+        groups_list = ["All Groups", *groups, "Ungrouped"]  # Add options to show all and ungrouped
         
         # For now, we'll use a simple approach - cycle through groups
         # In a more advanced implementation, you could create a proper selection modal
@@ -1010,19 +993,14 @@ class AliasManager(App):
     def action_filter_by_tag(self) -> None:
         """Filter aliases by tag"""
         # Always build tag list from ALL aliases
-        all_aliases = self.storage.list_all()
-        tags = set()
-        
-        # Collect all unique tags
-        for alias in all_aliases:
-            tags.update(alias.tags)
+        tags = self.storage.get_tags()
         
         if not tags:
             self.notify("No tags found. Create some aliases with tags first.", severity="warning")
             return
         
         # Create tag list with special options
-        tags_list = ["All Tags"] + sorted(list(tags)) + ["Untagged"]
+        tags_list = ["All Tags"] + tags + ["Untagged"]
         
         # Find current filter and cycle to next
         current_filter = getattr(self, '_current_tag_filter', None)
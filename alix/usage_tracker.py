@@ -1,11 +1,13 @@
 """Usage tracking functionality for aliases"""
 
+import heapq
 import os
 import json
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
+from operator import attrgetter, itemgetter
 
 from alix.models import Alias, UsageRecord
 
@@ -91,8 +93,8 @@ class UsageTracker:
         self.tracking_data["last_updated"] = now.isoformat()
         self._save_tracking_data()
     
-    def get_usage_analytics(self, aliases: List[Alias]) -> UsageAnalytics:
-        """Generate comprehensive usage analytics"""
+    def get_usage_analytics(self, aliases: List[Alias], top_k: int = 10) -> UsageAnalytics:
+        """Generate comprehensive usage analytics, ranking only the top_k most productive aliases"""
         if not aliases:
             return UsageAnalytics(
                 total_aliases=0,
@@ -108,8 +110,8 @@ class UsageTracker:
         
         # Basic statistics
         total_uses = sum(alias.used_count for alias in aliases)
-        most_used = max(aliases, key=lambda a: a.used_count) if aliases else None
-        least_used = min(aliases, key=lambda a: a.used_count) if aliases else None
+        most_used = max(aliases, key=attrgetter("used_count")) if aliases else None
+        least_used = min(aliases, key=attrgetter("used_count")) if aliases else None
         
         # Unused aliases (never used)
         unused_aliases = [alias.name for alias in aliases if alias.used_count == 0]
@@ -125,11 +127,9 @@ class UsageTracker:
         usage_trends = self.tracking_data.get("daily_usage", {})
         
         # Most productive aliases (by characters saved)
-        most_productive = [
-            (alias.name, len(alias.command) - len(alias.name))
-            for alias in aliases
-        ]
-        most_productive.sort(key=lambda x: x[1], reverse=True)
+        most_productive = heapq.nlargest(
+            top_k, ((alias.name, alias.chars_saved) for alias in aliases), key=itemgetter(1)
+        )
         
         return UsageAnalytics(
             total_aliases=len(aliases),
@@ -140,7 +140,7 @@ class UsageTracker:
             recently_used=recently_used,
             usage_trends=usage_trends,
             average_usage_per_alias=total_uses / len(aliases) if aliases else 0,
-            most_productive_aliases=most_productive[:10]
+            most_productive_aliases=most_productive
         )
     
     def get_alias_usage_history(self, alias_name: str, days: int = 30) -> List[Dict]:
@@ -148,14 +148,17 @@ class UsageTracker:
         alias_data = self.tracking_data.get("alias_usage", {}).get(alias_name, {})
         usage_dates = alias_data.get("usage_dates", [])
         
-        # Filter to last N days
+        # Filter to last N days, formatting each date for display while it is already parsed
         cutoff_date = datetime.now() - timedelta(days=days)
-        recent_usage = [
-            date for date in usage_dates
-            if datetime.fromisoformat(date) >= cutoff_date
-        ]
-        
-        return [{"date": date, "count": 1} for date in recent_usage]
+        recent_usage = []
+        for date in usage_dates:
+            used_at = datetime.fromisoformat(date)
+            if used_at >= cutoff_date:
+                recent_usage.append(
+                    {"date": date, "display_date": used_at.strftime("%Y-%m-%d %H:%M"), "count": 1}
+                )
+        
+        return recent_usage
     
     def cleanup_old_data(self, days_to_keep: int = 90) -> None:
         """Clean up old tracking data to prevent file bloat"""
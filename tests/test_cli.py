@@ -1,18 +1,23 @@
+import json
+from pathlib import Path
 from unittest.mock import ANY, patch
 
+import pytest
 from click.testing import CliRunner
+from rich.console import Console
 
+from alix import __version__, cli
 from alix.cli import main
+from alix.scanner import AliasScanner
 from alix.shell_integrator import ShellIntegrator
 
 
 @patch.object(ShellIntegrator, "apply_single_alias")
-@patch("alix.cli.subprocess")
+@patch.object(AliasScanner, "find_existing_command", return_value=None)
 @patch("alix.cli.storage")
-def test_cli_add(mock_storage, mock_subprocess, mock_apply, alias):
+def test_cli_add(mock_storage, mock_find_existing, mock_apply, alias):
     mock_storage.add.return_value = True
     mock_storage.get.return_value = None
-    mock_subprocess.run.return_value.returncode = 1
     mock_apply.return_value = (True, "✓ Applied alias 'alix-test-echo' to .zshrc")
     alias.created_at = ANY
     alias.shell = ANY
@@ -36,7 +41,7 @@ def test_cli_add(mock_storage, mock_subprocess, mock_apply, alias):
     assert result.exit_code == 0
 
     mock_storage.get.assert_called_with("alix-test-echo")
-    mock_subprocess.run.assert_called()
+    mock_find_existing.assert_called_once_with("alix-test-echo")
     mock_storage.add.assert_called_with(alias, record_history=True)
 
     assert "✔ Added alias: alix-test-echo = 'alix test working!'" in result.output
@@ -76,12 +81,10 @@ def test_cli_add__already_in_storage(mock_storage, mock_apply):
 
 
 @patch.object(ShellIntegrator, "apply_single_alias")
-@patch("alix.cli.subprocess")
+@patch.object(AliasScanner, "find_existing_command", return_value="alix-test-echo: aliased to echo hi (in .zshrc)")
 @patch("alix.cli.storage")
-def test_cli_add__already_an_alias(mock_storage, mock_subprocess, mock_apply):
+def test_cli_add__already_an_alias(mock_storage, mock_find_existing, mock_apply):
     mock_storage.get.return_value = None
-    mock_subprocess.run.return_value.returncode = 0
-    mock_subprocess.run.return_value.stdout = "Edit the alias to override it"
 
     runner = CliRunner()
     result = runner.invoke(
@@ -133,7 +136,7 @@ def test_cli_add__apply_failed(mock_storage, mock_apply, alias):
 
     assert result.exit_code == 0
     mock_storage.add.assert_called_with(alias, record_history=True)
-    mock_apply.assert_called_with(alias)
+    mock_apply.assert_called_with(alias, target_file=ANY)
 
     assert "Added alias: alix-test-echo = 'alix test working!'" in result.output
     assert (
@@ -181,3 +184,485 @@ def test_cli_add__no_apply(mock_storage, mock_apply, alias):
         "⚠ Alias saved but not applied: alix-test-echo = 'alix test working!'"
         not in result.output
     )
+
+
+@patch("alix.cli.storage")
+def test_cli_stats(mock_storage, alias):
+    mock_storage.list_all.return_value = [alias]
+    mock_storage.backup_count = 2
+    mock_storage.storage_path = Path("/tmp/aliases.json")
+    mock_storage.get_usage_analytics.return_value = {
+        "total_uses": 0,
+        "average_usage_per_alias": 0.0,
+        "most_used_alias": "alix-test-echo",
+        "unused_aliases": ["alix-test-echo"],
+        "recently_used": [],
+        "usage_trends": {},
+        "most_productive_aliases": [("alix-test-echo", 4)],
+    }
+
+    runner = CliRunner()
+    result = runner.invoke(main, ["stats"])
+
+    assert result.exit_code == 0
+    assert "Total Aliases: 1" in result.output
+    assert "Characters Saved: ~4 keystrokes" in result.output
+    assert "Backups: 2 files" in result.output
+    assert "alix-test-echo" in result.output
+    assert "saves 4 chars" in result.output
+    mock_storage.list_all.assert_called_once()
+    mock_storage.get_usage_analytics.assert_called_once_with([alias], top_k=10)
+
+
+@patch("alix.cli.console", Console(force_terminal=True, width=120))
+@patch("alix.cli.config")
+@patch("alix.cli.storage")
+def test_cli_list(mock_storage, mock_config, alias):
+    mock_storage.list_sorted.return_value = [alias]
+    mock_config.get.return_value = True
+    mock_config.get_theme.return_value = {"header_color": "cyan", "success_color": "green"}
+
+    runner = CliRunner()
+    result = runner.invoke(main, ["list"])
+
+    assert result.exit_code == 0
+    assert "Your Aliases (1 total)" in result.output
+    assert "alix-test-echo" in result.output
+    assert "alix test shortcut" in result.output
+
+
+@patch("alix.cli.console", Console(width=120, no_color=True, highlight=False))
+@patch("alix.cli.storage")
+def test_cli_tag_list(mock_storage):
+    from alix.models import Alias
+
+    gp = Alias(name="gp", command="git push", tags=["git", "remote"])
+    gs = Alias(name="gs", command="git status", tags=["git"])
+    mock_storage.iter_tags.return_value = iter([("git", [gp, gs]), ("remote", [gp])])
+
+    runner = CliRunner()
+    result = runner.invoke(main, ["tag", "list"])
+
+    assert result.exit_code == 0
+    assert "Tags (2 total)" in result.output
+    assert "gp, gs" in result.output
+    assert "remote" in result.output
+
+
+@patch("alix.cli.storage")
+def test_cli_tag_add__skips_existing_and_repeated_tags(mock_storage, alias):
+    mock_storage.get.return_value = alias
+
+    runner = CliRunner()
+    result = runner.invoke(main, ["tag", "add", alias.name, "b", "c", "c"])
+
+    assert result.exit_code == 0
+    assert "Added 1 tag(s)" in result.output
+    assert "Current tags: a, b, c" in result.output
+    mock_storage.set_tags.assert_called_once_with(alias.name, ["a", "b", "c"])
+    history_op, = mock_storage.history.push.call_args.args
+    assert history_op["added_tags"] == ["c"]
+
+
+@patch("alix.cli.storage")
+def test_cli_tag_add__all_existing_does_not_save(mock_storage, alias):
+    mock_storage.get.return_value = alias
+
+    runner = CliRunner()
+    result = runner.invoke(main, ["tag", "add", alias.name, "a", "b"])
+
+    assert result.exit_code == 0
+    assert "All specified tags already exist" in result.output
+    mock_storage.set_tags.assert_not_called()
+    mock_storage.save.assert_not_called()
+
+
+@patch("alix.cli.storage")
+def test_cli_tag_remove(mock_storage, alias):
+    mock_storage.get.return_value = alias
+
+    runner = CliRunner()
+    result = runner.invoke(main, ["tag", "remove", alias.name, "a", "x"])
+
+    assert result.exit_code == 0
+    assert "Removed 1 tag(s)" in result.output
+    assert "Remaining tags: b" in result.output
+    mock_storage.set_tags.assert_called_once_with(alias.name, ["b"])
+    history_op, = mock_storage.history.push.call_args.args
+    assert history_op["removed_tags"] == ["a"]
+
+
+@patch("alix.cli.console", Console(width=120, no_color=True, highlight=False))
+def test_cli_tag_stats__shows_top_ten_by_count():
+    tag_counts = {f"tag{i:02d}": i for i in range(1, 13)}
+    statistics = {
+        "total_tags": len(tag_counts),
+        "total_aliases": 20,
+        "tagged_aliases": 20,
+        "untagged_aliases": 0,
+        "tag_counts": tag_counts,
+        "tag_combinations": {},
+    }
+
+    with (
+        patch("alix.porter.AliasPorter.get_tag_statistics", return_value=statistics),
+        patch("alix.porter.AliasStorage"),
+    ):
+        runner = CliRunner()
+        result = runner.invoke(main, ["tag", "stats"])
+
+    assert result.exit_code == 0
+    assert "tag12" in result.output
+    assert "tag03" in result.output
+    assert "tag02" not in result.output
+    assert result.output.index("tag12") < result.output.index("tag11")
+
+
+@patch("alix.cli.console", Console(force_terminal=True, width=120))
+@patch("alix.cli.PLAIN_LIST_THRESHOLD", 0)
+@patch("alix.cli.storage")
+def test_cli_tag_show__plain_rows_for_large_tags(mock_storage, alias):
+    mock_storage.get_by_tag.return_value = [alias]
+
+    runner = CliRunner()
+    result = runner.invoke(main, ["tag", "show", "a"])
+
+    assert result.exit_code == 0
+    assert "Name            Command             Description         Tags" in result.output
+    assert "alix-test-echo  alix test working!  alix test shortcut  a, b" in result.output
+
+
+@patch("alix.cli.storage")
+def test_cli_tag_show__piped_output_is_tab_separated(mock_storage, alias):
+    mock_storage.get_by_tag.return_value = [alias]
+
+    runner = CliRunner()
+    result = runner.invoke(main, ["tag", "show", "a"])
+
+    assert result.exit_code == 0
+    assert result.output == "alix-test-echo\talix test working!\n"
+
+
+@patch("alix.cli.storage")
+def test_cli_tag_rename(mock_storage, alias):
+    mock_storage.get_by_tag.return_value = [alias]
+
+    runner = CliRunner()
+    result = runner.invoke(main, ["tag", "rename", "a", "z", "-y"])
+
+    assert result.exit_code == 0
+    assert "Renamed tag in 1 aliases" in result.output
+    mock_storage.set_tags.assert_called_once_with(alias.name, ["z", "b"])
+    mock_storage.save.assert_called_once()
+    history_op, = mock_storage.history.push.call_args.args
+    assert history_op["aliases"] == [alias.to_dict()]
+
+
+@patch("alix.cli.storage")
+def test_cli_tag_delete(mock_storage, alias):
+    mock_storage.get_by_tag.return_value = [alias]
+
+    runner = CliRunner()
+    result = runner.invoke(main, ["tag", "delete", "a", "-y"])
+
+    assert result.exit_code == 0
+    assert "Removed tag from 1 aliases" in result.output
+    mock_storage.set_tags.assert_called_once_with(alias.name, ["b"])
+    mock_storage.save.assert_called_once()
+
+
+@patch("alix.cli.console", Console(force_terminal=True, width=120))
+@patch("alix.cli.config")
+@patch("alix.cli.storage")
+def test_cli_list__wide_names_are_not_cut(mock_storage, mock_config, alias):
+    alias.name = "日本語テスト"
+    mock_storage.list_sorted.return_value = [alias]
+    mock_config.get.return_value = True
+    mock_config.get_theme.return_value = {"header_color": "cyan", "success_color": "green"}
+
+    runner = CliRunner()
+    result = runner.invoke(main, ["list"])
+
+    assert result.exit_code == 0
+    assert "日本語テスト" in result.output
+
+
+@patch("alix.cli.console", Console(width=120, no_color=True))
+def test_print_plain_rows__aligns_wide_characters(capsys):
+    cli._print_plain_rows([("Name", "Command"), ("日本", "echo jp"), ("gs", "git status")])
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines == ["Name  Command", "日本  echo jp", "gs    git status"]
+
+
+@patch("alix.cli.config")
+@patch("alix.cli.storage")
+def test_cli_list__piped_output_is_tab_separated(mock_storage, mock_config, alias):
+    mock_storage.list_sorted.return_value = [alias]
+
+    runner = CliRunner()
+    result = runner.invoke(main, ["list"])
+
+    assert result.exit_code == 0
+    assert result.output == "alix-test-echo\talix test working!\n"
+    mock_config.get_theme.assert_not_called()
+
+
+@patch("alix.cli.console", Console(force_terminal=True, width=120))
+@patch("alix.cli.PLAIN_LIST_THRESHOLD", 0)
+@patch("alix.cli.config")
+@patch("alix.cli.storage")
+def test_cli_list__plain_rows_for_large_collections(mock_storage, mock_config, alias):
+    mock_storage.list_sorted.return_value = [alias]
+    mock_config.get.return_value = True
+
+    runner = CliRunner()
+    result = runner.invoke(main, ["list"])
+
+    assert result.exit_code == 0
+    assert "Name            Command             Description         Tags" in result.output
+    assert "alix-test-echo  alix test working!  alix test shortcut  a, b" in result.output
+    mock_config.get_theme.assert_not_called()
+
+
+@patch("alix.cli.console")
+@patch("alix.cli.storage")
+def test_cli_track(mock_storage, mock_console, alias):
+    alias.used_count = 3
+    alias.last_used = None
+    mock_storage.track_usage.return_value = alias
+
+    runner = CliRunner()
+    result = runner.invoke(main, ["track", "alix-test-echo", "-c", "cwd:/tmp"])
+
+    assert result.exit_code == 0
+    assert "Tracked usage of alias 'alix-test-echo'" in result.output
+    assert "Total uses: 3" in result.output
+    mock_storage.track_usage.assert_called_once_with("alix-test-echo", "cwd:/tmp")
+    mock_console.print.assert_not_called()
+
+
+def test_cli_about():
+    runner = CliRunner()
+    first = runner.invoke(main, ["about"])
+    second = runner.invoke(main, ["about"])
+
+    assert first.exit_code == 0
+    assert f"alix v{__version__}" in first.output
+    assert second.output == first.output
+
+
+@patch("alix.cli.storage")
+def test_cli_scan__streams_system_files(mock_storage, alias):
+    mock_storage.add_many.side_effect = lambda aliases, skip_existing: (list(aliases), 0)
+
+    with patch("alix.scanner.AliasScanner.iter_scan_system") as mock_iter_scan_system:
+        mock_iter_scan_system.return_value = iter([(".zshrc", [alias])])
+        runner = CliRunner()
+        result = runner.invoke(main, ["scan", "--tag", "imported"])
+
+    assert result.exit_code == 0
+    assert ".zshrc: 1 aliases" in result.output
+    assert "Found 1 total aliases in system files" in result.output
+    assert "Imported: alix-test-echo" in result.output
+    assert "Imported: 1 aliases" in result.output
+    mock_storage.add_many.assert_called_once_with(ANY, skip_existing=True)
+    assert "imported" in alias.tags
+
+
+@patch("alix.cli.storage")
+def test_cli_scan__all_skipped_prints_no_blank_line(mock_storage, alias, tmp_path):
+    mock_storage.add_many.return_value = ([], 1)
+    alias_file = tmp_path / "aliases.sh"
+    alias_file.touch()
+
+    with patch("alix.scanner.AliasScanner.scan_file", return_value=[alias]):
+        runner = CliRunner()
+        result = runner.invoke(main, ["scan", "--source", "file", "--file", str(alias_file)])
+
+    assert result.exit_code == 0
+    assert result.output.startswith("Found 1 aliases in aliases.sh\n\nImport Complete!\n")
+    assert "Skipped: 1 existing aliases" in result.output
+
+
+@patch("alix.cli.storage")
+def test_cli_scan__nothing_found(mock_storage):
+    mock_storage.add_many.side_effect = lambda aliases, skip_existing: (list(aliases), 0)
+
+    with patch("alix.scanner.AliasScanner.iter_scan_system") as mock_iter_scan_system:
+        mock_iter_scan_system.return_value = iter([])
+        runner = CliRunner()
+        result = runner.invoke(main, ["scan"])
+
+    assert result.exit_code == 0
+    assert "No aliases found to import" in result.output
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+@patch("alix.cli.storage")
+def test_cli_group_import(mock_storage, use_orjson, alias, tmp_path):
+    mock_storage.aliases = {}
+    export_file = tmp_path / "group.json"
+    export_file.write_text(json.dumps({"group": "tools", "aliases": {alias.name: alias.to_dict()}}))
+
+    with patch("alix.cli.orjson", cli.orjson if use_orjson else None):
+        runner = CliRunner()
+        result = runner.invoke(main, ["group", "import", str(export_file)])
+
+    assert result.exit_code == 0
+    assert "Imported 1 aliases to group 'tools'" in result.output
+    (imported,), = mock_storage.bulk_update.call_args.args
+    assert imported.name == alias.name
+    assert imported.group == "tools"
+    history_op, = mock_storage.history.push.call_args.args
+    assert history_op["type"] == "group_import"
+    assert history_op["aliases"] == [imported.to_dict()]
+
+
+@patch("alix.cli.storage")
+def test_cli_tag_import__filters_by_tag(mock_storage, alias, tmp_path):
+    from alix.models import Alias
+
+    mock_storage.aliases = {}
+    other = Alias(name="other", command="echo other", tags=["c"])
+    export_file = tmp_path / "tags.json"
+    export_file.write_text(json.dumps({"aliases": [alias.to_dict(), other.to_dict()]}))
+
+    runner = CliRunner()
+    result = runner.invoke(main, ["tag", "import-tag", str(export_file), "--tag", "a"])
+
+    assert result.exit_code == 0
+    assert "Imported 1 aliases" in result.output
+    assert "Filtered out 1 aliases" in result.output
+    (imported,), = mock_storage.bulk_update.call_args.args
+    assert imported.name == alias.name
+
+
+@patch("alix.cli.storage")
+def test_cli_tag_import__skips_repeated_names(mock_storage, alias, tmp_path):
+    mock_storage.aliases = {}
+    export_file = tmp_path / "tags.json"
+    export_file.write_text(json.dumps({"aliases": [alias.to_dict(), alias.to_dict()]}))
+
+    runner = CliRunner()
+    result = runner.invoke(main, ["tag", "import-tag", str(export_file)])
+
+    assert result.exit_code == 0
+    assert "Imported 1 aliases" in result.output
+    assert "Skipped 1 existing aliases" in result.output
+    (imported,), = mock_storage.bulk_update.call_args.args
+    assert imported.name == alias.name
+
+
+@patch("alix.cli.storage")
+def test_cli_group_delete__yes_skips_prompt(mock_storage, alias):
+    alias.group = "web"
+    mock_storage.get_by_group.return_value = [alias]
+
+    runner = CliRunner()
+    result = runner.invoke(main, ["group", "delete", "web", "-y"])
+
+    assert result.exit_code == 0
+    assert "Are you sure" not in result.output
+    mock_storage.set_group.assert_called_once_with(alias.name, None)
+    mock_storage.save.assert_called_once_with()
+
+
+@patch("alix.cli.console", Console(width=120, no_color=True, highlight=False))
+@patch.object(ShellIntegrator, "get_target_file", return_value=Path("/tmp/.bashrc"))
+@patch.object(ShellIntegrator, "apply_aliases_batch", return_value=(False, "Disk full"))
+@patch("alix.cli.storage")
+def test_cli_group_apply__failure_reported_once(mock_storage, mock_apply_batch, mock_target, alias):
+    from alix.models import Alias
+
+    mock_storage.get_by_group.return_value = [alias, Alias(name="other", command="echo other")]
+
+    runner = CliRunner()
+    result = runner.invoke(main, ["group", "apply", "web"])
+
+    assert result.exit_code == 0
+    assert result.output.count("Failed") == 1
+    assert "✗ Failed to apply to /tmp/.bashrc: Disk full" in result.output
+    assert "0/2 aliases applied successfully" in result.output
+    assert "source" not in result.output
+
+
+@patch("alix.cli.storage")
+def test_cli_group_delete__declined(mock_storage):
+    runner = CliRunner()
+    result = runner.invoke(main, ["group", "delete", "web"], input="n\n")
+
+    assert result.exit_code == 1
+    assert "Aborted!" in result.output
+    mock_storage.set_group.assert_not_called()
+
+
+@patch("alix.cli.storage")
+def test_cli_list_undo(mock_storage):
+    mock_storage.history.list_undo.return_value = [
+        {"type": "add", "aliases": [{"name": "gs"}], "timestamp": "2025-10-24T21:01:01"},
+        {"type": "tag_add", "aliases": [{"name": n} for n in "abcd"], "timestamp": "2025-10-25T08:00:00"},
+    ]
+
+    runner = CliRunner()
+    result = runner.invoke(main, ["list-undo"])
+
+    assert result.exit_code == 0
+    assert "1. ➕ ADD gs" in result.output
+    assert "at 2025-10-24 21:01:01" in result.output
+    assert "2. 🏷️➕ TAG_ADD a, b, c ... (+1 more)" in result.output
+
+
+@patch("alix.shell_wrapper.ShellWrapper.create_standalone_tracking_script", return_value=True)
+def test_cli_setup_tracking__explicit_shell(mock_create, tmp_path):
+    output = tmp_path / "tracking.sh"
+
+    runner = CliRunner()
+    result = runner.invoke(main, ["setup-tracking", "--standalone", "-s", "bash", "-o", str(output)])
+
+    assert result.exit_code == 0
+    mock_create.assert_called_once_with(output, "bash")
+
+
+def test_cli_completion__prints_script():
+    runner = CliRunner()
+    result = runner.invoke(main, ["completion", "bash"])
+
+    assert result.exit_code == 0
+    assert "_alix_completion()" in result.output
+    assert "_ALIX_COMPLETE=bash_complete" in result.output
+
+
+def test_completion_script__cached_per_shell():
+    cli._completion_script.cache_clear()
+
+    assert cli._completion_script("zsh") is cli._completion_script("zsh")
+    assert cli._completion_script("sh") is None
+    assert cli._completion_script.cache_info().hits == 1
+
+
+@pytest.mark.parametrize(
+    "timestamp, expected",
+    [
+        ("2025-10-24T21:01:01.123456", "2025-10-24 21:01:01"),
+        ("2025-10-24T21:01:01+00:00", "2025-10-24 21:01:01"),
+        ("N/A", "N/A"),
+    ],
+)
+def test_display_timestamp(timestamp, expected):
+    assert cli._display_timestamp(timestamp) == expected
+
+
+@patch("alix.cli.storage")
+def test_cli_history__keeps_most_recent_days(mock_storage):
+    mock_storage.get_usage_analytics.return_value = {
+        "usage_trends": {"2025-10-20": 1, "2025-10-24": 4, "2025-10-22": 2},
+    }
+
+    runner = CliRunner()
+    result = runner.invoke(main, ["history", "--days", "2"])
+
+    assert result.exit_code == 0
+    assert "Total usage in last 2 days: 6" in result.output
+    assert "2025-10-24: 4 uses\n  2025-10-22: 2 uses" in result.output
+    assert "2025-10-20" not in result.output
@@ -1,6 +1,7 @@
 import pytest
 from click.testing import CliRunner
 from unittest.mock import patch, MagicMock
+from rich.console import Console
 
 from alix.cli import main
 from alix.template_manager import TemplateManager
@@ -36,7 +37,8 @@ class TestTemplatesCLI:
 
         return mock_manager
 
-    @patch("alix.cli.TemplateManager")
+    @patch("alix.cli.console", Console(force_terminal=True, width=120))
+    @patch("alix.template_manager.TemplateManager")
     def test_templates_list_command(self, mock_template_manager_class, runner, mock_template_manager):
         """Test templates list command"""
         mock_template_manager_class.return_value = mock_template_manager
@@ -48,7 +50,18 @@ class TestTemplatesCLI:
         assert "git" in result.output
         assert "Git version control aliases" in result.output
 
-    @patch("alix.cli.TemplateManager")
+    @patch("alix.template_manager.TemplateManager")
+    def test_templates_list_command_piped(self, mock_template_manager_class, runner, mock_template_manager):
+        """Test templates list emits tab-separated lines when output is piped"""
+        mock_template_manager_class.return_value = mock_template_manager
+
+        result = runner.invoke(main, ["templates", "list"])
+
+        assert result.exit_code == 0
+        assert result.output == "git\tgit\tGit version control aliases\n"
+        mock_template_manager.get_categories.assert_not_called()
+
+    @patch("alix.template_manager.TemplateManager")
     def test_templates_add_command_success(self, mock_template_manager_class, runner, mock_template_manager):
         """Test templates add command success"""
         mock_template_manager_class.return_value = mock_template_manager
@@ -59,7 +72,7 @@ class TestTemplatesCLI:
         assert "Imported 2 aliases from 'git'" in result.output
         mock_template_manager.import_template.assert_called_once_with("git", None)
 
-    @patch("alix.cli.TemplateManager")
+    @patch("alix.template_manager.TemplateManager")
     def test_templates_add_command_not_exists(self, mock_template_manager_class, runner, mock_template_manager):
         """Test templates add command with non-existent template"""
         mock_template_manager.get_template.return_value = None
@@ -71,7 +84,7 @@ class TestTemplatesCLI:
         assert result.exit_code == 0
         assert "Template 'nonexistent' not found" in result.output
 
-    @patch("alix.cli.TemplateManager")
+    @patch("alix.template_manager.TemplateManager")
     def test_templates_add_command_dry_run(self, mock_template_manager_class, runner, mock_template_manager):
         """Test templates add command with dry-run"""
         from alix.models import Alias
@@ -93,7 +106,7 @@ class TestTemplatesCLI:
         assert "Preview: Would import from 'git'" in result.output
         mock_template_manager.import_template.assert_not_called()
 
-    @patch("alix.cli.TemplateManager")
+    @patch("alix.template_manager.TemplateManager")
     def test_templates_add_command_with_aliases(self, mock_template_manager_class, runner, mock_template_manager):
         """Test templates add command with alias filter"""
         mock_template_manager_class.return_value = mock_template_manager
@@ -103,7 +116,7 @@ class TestTemplatesCLI:
         assert result.exit_code == 0
         mock_template_manager.import_template.assert_called_once_with("git", ["gs", "ga"])
 
-    @patch("alix.cli.TemplateManager")
+    @patch("alix.template_manager.TemplateManager")
     def test_templates_add_category_command(self, mock_template_manager_class, runner, mock_template_manager):
         """Test templates add-category command"""
         mock_template_manager_class.return_value = mock_template_manager
@@ -114,7 +127,7 @@ class TestTemplatesCLI:
         assert "Imported 8 aliases from category 'git'" in result.output
         mock_template_manager.import_by_category.assert_called_once_with("git", None)
 
-    @patch("alix.cli.TemplateManager")
+    @patch("alix.template_manager.TemplateManager")
     def test_templates_add_category_not_exists(self, mock_template_manager_class, runner, mock_template_manager):
         """Test templates add-category command with non-existent category"""
         mock_template_manager.get_categories.return_value = ["git", "docker"]
@@ -126,7 +139,7 @@ class TestTemplatesCLI:
         assert result.exit_code == 0
         assert "Category 'nonexistent' not found" in result.output
 
-    @patch("alix.cli.TemplateManager")
+    @patch("alix.template_manager.TemplateManager")
     def test_templates_add_category_dry_run(self, mock_template_manager_class, runner, mock_template_manager):
         """Test templates add-category command with dry-run"""
         mock_template_manager_class.return_value = mock_template_manager
@@ -137,7 +150,7 @@ class TestTemplatesCLI:
         assert "Preview: Would import from category 'git'" in result.output
         mock_template_manager.import_by_category.assert_not_called()
 
-    @patch("alix.cli.TemplateManager")
+    @patch("alix.template_manager.TemplateManager")
     def test_templates_add_category_with_aliases(self, mock_template_manager_class, runner, mock_template_manager):
         """Test templates add-category command with alias filter"""
         mock_template_manager_class.return_value = mock_template_manager
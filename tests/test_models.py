@@ -0,0 +1,24 @@
+from alix.models import Alias
+
+
+def test_chars_saved():
+    alias = Alias(name="gs", command="git status")
+
+    assert alias.chars_saved == 8
+
+
+def test_chars_saved__follows_in_place_edits():
+    alias = Alias(name="gs", command="git status")
+
+    alias.command = "git status --short"
+    assert alias.chars_saved == 16
+
+    alias.name = "gss"
+    assert alias.chars_saved == 15
+
+
+def test_chars_saved__not_serialized(alias):
+    data = alias.to_dict()
+
+    assert "chars_saved" not in data
+    assert Alias.from_dict(data) == alias
@@ -281,8 +281,8 @@ class TestPorterTagFiltering:
         alias2 = Alias(name="alias2", command="echo 2", tags=["tag2"])
         alias3 = Alias(name="alias3", command="echo 3", tags=["tag1", "tag2"])
 
-        # Mock storage to return our test aliases
-        porter.storage.list_all = Mock(return_value=[alias1, alias2, alias3])
+        # Load our test aliases into storage
+        porter.storage.aliases = {alias.name: alias for alias in (alias1, alias2, alias3)}
 
         mocked_open = mock_open()
 
@@ -309,8 +309,8 @@ class TestPorterTagFiltering:
         alias2 = Alias(name="alias2", command="echo 2", tags=["tag2"])
         alias3 = Alias(name="alias3", command="echo 3", tags=["tag1", "tag2"])
 
-        # Mock storage to return our test aliases
-        porter.storage.list_all = Mock(return_value=[alias1, alias2, alias3])
+        # Load our test aliases into storage
+        porter.storage.aliases = {alias.name: alias for alias in (alias1, alias2, alias3)}
 
         mocked_open = mock_open()
 
@@ -336,8 +336,8 @@ class TestPorterTagFiltering:
         alias1 = Alias(name="alias1", command="echo 1", tags=["other"])
         alias2 = Alias(name="alias2", command="echo 2", tags=["different"])
 
-        # Mock storage to return our test aliases
-        porter.storage.list_all = Mock(return_value=[alias1, alias2])
+        # Load our test aliases into storage
+        porter.storage.aliases = {alias.name: alias for alias in (alias1, alias2)}
 
         result = porter.export_by_tags(["tag1", "tag2"], Path("/tmp/test.json"))
 
@@ -355,7 +355,7 @@ class TestPorterTagFiltering:
 
         # Create test aliases
         alias1 = Alias(name="alias1", command="echo 1", tags=["tag1"])
-        porter.storage.list_all = Mock(return_value=[alias1])
+        porter.storage.aliases = {"alias1": alias1}
 
         # Mock the json.dump to raise exception
         mock_json.dump.side_effect = Exception("Disk write error")
@@ -377,7 +377,7 @@ class TestPorterTagFiltering:
 
         # Create test aliases
         alias1 = Alias(name="alias1", command="echo 1", tags=["tag1"])
-        porter.storage.list_all = Mock(return_value=[alias1])
+        porter.storage.aliases = {"alias1": alias1}
 
         # Mock the yaml.dump to raise exception
         mock_yaml.dump.side_effect = Exception("YAML write error")
@@ -417,6 +417,7 @@ class TestPorterTagFiltering:
         assert stats["tag_counts"]["tag1"] == 2  # alias1, alias3
         assert stats["tag_counts"]["tag2"] == 2  # alias1, alias2
         assert stats["tag_counts"]["tag3"] == 1  # alias2
+        assert list(stats["tag_counts"]) == ["tag1", "tag2", "tag3"]  # Most used first
 
         # Verify tag combinations (pairs)
         assert ("tag1", "tag2") in stats["tag_combinations"]
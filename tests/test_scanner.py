@@ -40,6 +40,28 @@ def test_scan_system__no_aliases(mock_detect_current_shell, mock_find_config_fil
     assert results == {}
 
 
+@patch.object(ShellDetector, "find_config_files")
+@patch.object(ShellDetector, "detect_current_shell")
+def test_iter_scan_system__scans_files_lazily(
+    mock_detect_current_shell, mock_find_config_files, shell_file_data
+):
+    mock_detect_current_shell.return_value = ShellType.ZSH
+    first, second = Mock(spec=Path), Mock(spec=Path)
+    for mock_path, name in ((first, ".zshrc"), (second, ".zprofile")):
+        mock_path.name = name
+        mock_path.exists.return_value = True
+        mock_path.read_text.return_value = shell_file_data
+    mock_find_config_files.return_value = {".zshrc": first, ".zprofile": second}
+
+    results = AliasScanner().iter_scan_system()
+    filename, aliases = next(results)
+
+    assert filename == ".zshrc"
+    assert aliases[0].name == "alix-test-echo"
+    second.read_text.assert_not_called()
+    assert [filename for filename, _ in results] == [".zprofile"]
+
+
 @patch("alix.scanner.subprocess")
 @patch.object(ShellDetector, "detect_current_shell")
 def test_get_active_aliases(
@@ -81,3 +103,38 @@ def test_get_active_aliases__failed_run(mock_detect_current_shell, mock_subproce
     results = scanner.get_active_aliases()
 
     assert len(results) == 0
+
+
+@patch("alix.scanner.shutil.which", return_value=None)
+@patch.object(AliasScanner, "iter_scan_system")
+def test_find_existing_command__config_alias(mock_scan, mock_which, alias):
+    mock_scan.side_effect = lambda: iter([(".zshrc", [alias])])
+
+    scanner = AliasScanner()
+
+    assert scanner.find_existing_command(alias.name) == (
+        "alix-test-echo: aliased to alix test working! (in .zshrc)"
+    )
+    assert scanner.find_existing_command("not-defined") is None
+
+
+@patch("alix.scanner.shutil.which", return_value="/usr/bin/ls")
+@patch.object(AliasScanner, "iter_scan_system")
+def test_find_existing_command__on_path(mock_scan, mock_which):
+    assert AliasScanner().find_existing_command("ls") == "/usr/bin/ls"
+    mock_scan.assert_not_called()
+
+
+@patch("alix.scanner.shutil.which", return_value=None)
+@patch.object(ShellDetector, "find_config_files")
+@patch.object(ShellDetector, "detect_current_shell", return_value=ShellType.BASH)
+def test_find_existing_command__shell_functions_not_detected(mock_detect, mock_find_config_files, mock_which, tmp_path):
+    # Only PATH and config aliases are checked; functions are not parsed out of the config files
+    bashrc = tmp_path / ".bashrc"
+    bashrc.write_text("alias gs='git status'\ngst() {\n    git status -sb\n}\n")
+    mock_find_config_files.return_value = {".bashrc": bashrc}
+
+    scanner = AliasScanner()
+
+    assert scanner.find_existing_command("gs") == "gs: aliased to git status (in .bashrc)"
+    assert scanner.find_existing_command("gst") is None
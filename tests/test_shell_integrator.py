@@ -79,6 +79,15 @@ class TestShellIntegratorInit:
             assert integrator.storage == mock_storage_instance
             mock_detector_instance.detect_current_shell.assert_called_once()
 
+    def test_init_reuses_given_storage(self, mock_storage):
+        """Test that a storage passed in is used instead of loading a new one"""
+        with patch('alix.shell_integrator.ShellDetector'), \
+             patch('alix.shell_integrator.AliasStorage') as mock_storage_class:
+            integrator = ShellIntegrator(mock_storage)
+
+        assert integrator.storage is mock_storage
+        mock_storage_class.assert_not_called()
+
     def test_init_detects_shell_type(self, mock_detector):
         """Test that shell_type is set from detector"""
         with patch('alix.shell_integrator.ShellDetector', return_value=mock_detector):
@@ -139,6 +148,19 @@ class TestGetTargetFile:
         result = shell_integrator.get_target_file()
         assert result == Path("/home/user/.config/fish/config.fish")
 
+    def test_get_target_file_cached_per_shell_type(self, shell_integrator, mock_detector):
+        """Test repeated lookups reuse the result until the shell type changes"""
+        mock_detector.find_config_files.return_value = {".bashrc": Path("/home/user/.bashrc")}
+        shell_integrator.shell_type = ShellType.BASH
+
+        assert shell_integrator.get_target_file() == Path("/home/user/.bashrc")
+        assert shell_integrator.get_target_file() == Path("/home/user/.bashrc")
+        mock_detector.find_config_files.assert_called_once_with(ShellType.BASH)
+
+        mock_detector.find_config_files.return_value = {".zshrc": Path("/home/user/.zshrc")}
+        shell_integrator.shell_type = ShellType.ZSH
+        assert shell_integrator.get_target_file() == Path("/home/user/.zshrc")
+
 
 class TestBackupShellConfig:
     """Test backup_shell_config method"""
@@ -386,6 +408,52 @@ class TestApplySingleAlias:
             assert "alias test='echo test'" in content
             assert "# === ALIX MANAGED ALIASES START ===" in content
 
+    def test_apply_single_alias_given_target_file(self, shell_integrator, temp_config_file):
+        """Test a target file passed by the caller is used without detecting it again"""
+        alias = Alias(name="test", command="echo test")
+
+        with patch.object(shell_integrator, 'get_target_file') as mock_get_target_file:
+            success, _ = shell_integrator.apply_single_alias(alias, auto_reload=False, target_file=temp_config_file)
+
+        assert success
+        mock_get_target_file.assert_not_called()
+        assert "alias test='echo test'" in temp_config_file.read_text()
+
+    def test_apply_aliases_batch(self, shell_integrator, temp_config_file):
+        """Test applying several aliases writes the config once"""
+        temp_config_file.write_text(
+            "# Config\n"
+            "# === ALIX MANAGED ALIASES START ===\n"
+            "alias gs='git status'\n"
+            "# === ALIX MANAGED ALIASES END ===\n"
+        )
+        aliases = [
+            Alias(name="gs", command="git status -sb"),
+            Alias(name="ll", command="ls -l"),
+            Alias(name="ll", command="ls -la"),
+        ]
+
+        with patch.object(Path, "write_text", autospec=True, side_effect=Path.write_text) as mock_write:
+            success, message = shell_integrator.apply_aliases_batch(
+                aliases, auto_reload=False, target_file=temp_config_file
+            )
+
+        assert success
+        assert message == f"Applied 3 aliases to {temp_config_file.name}"
+        mock_write.assert_called_once()
+        content = temp_config_file.read_text()
+        assert "alias gs='git status'\nalias ll='ls -l'\n# === ALIX MANAGED ALIASES END ===" in content
+        assert "ls -la" not in content
+
+    def test_apply_aliases_batch_no_target(self, shell_integrator, mock_detector):
+        """Test batch apply without a shell config file"""
+        mock_detector.find_config_files.return_value = {}
+
+        success, message = shell_integrator.apply_aliases_batch([Alias(name="ll", command="ls -l")])
+
+        assert not success
+        assert "No shell configuration file found" in message
+
     def test_apply_single_alias_existing_section_add(self, shell_integrator, temp_config_file):
         """Test adding alias to existing alix section"""
         original_content = """# Config
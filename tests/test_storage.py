@@ -94,6 +94,17 @@ def test_load(storage_file_raw_data, alias):
     assert storage.aliases["alix-test-echo"] == alias
 
 
+@patch("alix.storage.orjson", None)
+def test_load__without_orjson(tmp_path, alias):
+    storage = AliasStorage(tmp_path / "aliases.json")
+    storage.aliases[alias.name] = alias
+    storage.save()
+
+    storage.load()
+
+    assert storage.aliases == {alias.name: alias}
+
+
 def test_load__corrupted_file():
     expected_data = '{"alix-test-echo": zzzzzz}'
     mocked_open = mock_open(read_data=expected_data)
@@ -122,7 +133,7 @@ def test_add(mock_json, alias, storage_file_data):
     storage = AliasStorage()
     storage.create_backup = mock_backup
 
-    with patch("alix.storage.open", mocked_open):
+    with patch("alix.storage.open", mocked_open), patch("alix.storage.os.replace") as mock_replace:
         result = storage.add(alias)
 
     assert result is True
@@ -131,6 +142,8 @@ def test_add(mock_json, alias, storage_file_data):
     mock_json.dump.assert_called_once_with(
         storage_file_data, mocked_open(), indent=2, default=str
     )
+    mocked_open.assert_any_call(storage.storage_path.with_name("aliases.json.tmp"), "w")
+    mock_replace.assert_called_once_with(storage.storage_path.with_name("aliases.json.tmp"), storage.storage_path)
 
 
 @patch("alix.storage.json")
@@ -158,7 +171,7 @@ def test_remove(mock_json, alias):
     storage.create_backup = mock_backup
     storage.aliases[alias.name] = alias
 
-    with patch("alix.storage.open", mocked_open):
+    with patch("alix.storage.open", mocked_open), patch("alix.storage.os.replace"):
         result = storage.remove(alias.name)
 
     assert result is True
@@ -182,6 +195,28 @@ def test_remove__alias_absent(mock_json, alias):
     mock_json.dump.assert_not_called()
 
 
+def test_update(tmp_path, alias):
+    storage = AliasStorage(tmp_path / "aliases.json")
+    storage.aliases[alias.name] = alias
+    storage.save()
+    storage.create_backup = Mock()
+    alias.command = "echo updated"
+
+    with patch.object(storage, "save", wraps=storage.save) as mock_save:
+        assert storage.update(alias) is True
+
+    mock_save.assert_called_once()
+    storage.create_backup.assert_called_once()
+    assert AliasStorage(tmp_path / "aliases.json").get(alias.name).command == "echo updated"
+
+
+def test_update__alias_absent(tmp_path, alias):
+    storage = AliasStorage(tmp_path / "aliases.json")
+
+    assert storage.update(alias) is False
+    assert alias.name not in storage.aliases
+
+
 def test_get(alias):
     storage = AliasStorage()
     storage.aliases[alias.name] = alias
@@ -200,6 +235,164 @@ def test_list_all(alias_list):
     assert list_all[1] == alias_list[1]
 
 
+def test_count(alias_list):
+    storage = AliasStorage()
+    storage.aliases.clear()  # Clear any loaded aliases for test isolation
+    assert storage.count() == 0
+
+    storage.aliases[alias_list[0].name] = alias_list[0]
+    assert storage.count() == 1
+
+
+def test_list_sorted__follows_alias_changes(tmp_path):
+    storage = AliasStorage(storage_path=tmp_path / "aliases.json")
+    storage.aliases["b"] = Alias(name="b", command="echo b")
+    storage.aliases["a"] = Alias(name="a", command="echo a")
+
+    assert [a.name for a in storage.list_sorted()] == ["a", "b"]
+
+    storage.aliases["c"] = Alias(name="c", command="echo c")
+    assert [a.name for a in storage.list_sorted()] == ["a", "b", "c"]
+
+    storage.aliases.update({"0": Alias(name="0", command="echo 0")})
+    assert [a.name for a in storage.list_sorted()] == ["0", "a", "b", "c"]
+
+    del storage.aliases["b"]
+    storage.aliases.pop("c")
+    assert [a.name for a in storage.list_sorted()] == ["0", "a"]
+
+    storage.remove("a", record_history=False)
+    assert [a.name for a in storage.list_sorted()] == ["0"]
+
+
+def test_list_sorted__reuses_sort_while_aliases_unchanged(tmp_path):
+    storage = AliasStorage(storage_path=tmp_path / "aliases.json")
+    storage.aliases["a"] = Alias(name="a", command="echo a")
+    storage.list_sorted()
+
+    with patch("alix.storage.sorted", create=True, side_effect=sorted) as mock_sorted:
+        storage.list_sorted()
+
+    mock_sorted.assert_not_called()
+
+
+def test_alias_map__lookups_without_changes_keep_sort(tmp_path):
+    storage = AliasStorage(storage_path=tmp_path / "aliases.json")
+    alias = Alias(name="a", command="echo a")
+    storage.aliases["a"] = alias
+    cached = storage.list_sorted()
+
+    assert storage.aliases.setdefault("a", Alias(name="a", command="echo other")) is alias
+    assert storage.aliases.pop("missing", None) is None
+
+    assert storage.list_sorted() is cached
+
+
+def test_add_many__single_save_and_history_entry(tmp_path):
+    storage = AliasStorage(storage_path=tmp_path / "aliases.json")
+    storage.add(Alias(name="gs", command="git status"), record_history=False)
+    incoming = [Alias(name="gs", command="git status -sb"), Alias(name="ll", command="ls -l")]
+
+    with patch.object(storage, "save", wraps=storage.save) as mock_save:
+        added, skipped = storage.add_many(iter(incoming))
+
+    assert [a.name for a in added] == ["ll"]
+    assert skipped == 1
+    assert storage.aliases["gs"].command == "git status"
+    mock_save.assert_called_once()
+    assert storage.history.undo[-1]["type"] == "import"
+    assert [a["name"] for a in storage.history.undo[-1]["aliases"]] == ["ll"]
+
+
+def test_add_many__skips_name_repeated_in_batch(tmp_path):
+    storage = AliasStorage(storage_path=tmp_path / "aliases.json")
+
+    added, skipped = storage.add_many([Alias(name="g", command="git"), Alias(name="g", command="grep")])
+
+    assert [a.command for a in added] == ["git"]
+    assert skipped == 1
+    assert storage.aliases["g"].command == "git"
+
+
+def test_add_many__replace_existing_is_undoable(tmp_path):
+    storage = AliasStorage(storage_path=tmp_path / "aliases.json")
+    storage.add(Alias(name="gs", command="git status"), record_history=False)
+
+    added, skipped = storage.add_many([Alias(name="gs", command="git status -sb")], skip_existing=False)
+
+    assert [a.command for a in added] == ["git status -sb"]
+    assert skipped == 0
+    assert [op["type"] for op in storage.history.undo] == ["remove", "import"]
+
+    storage.history.perform_undo(storage)
+    storage.history.perform_undo(storage)
+    assert storage.aliases["gs"].command == "git status"
+
+
+def test_add_many__history_entries_for_repeated_replacement(tmp_path):
+    storage = AliasStorage(storage_path=tmp_path / "aliases.json")
+    original = Alias(name="gs", command="git status")
+    storage.add(original, record_history=False)
+    incoming = [
+        Alias(name="gs", command="git status -s"),
+        Alias(name="ll", command="ls -l"),
+        Alias(name="gs", command="git status -sb"),
+    ]
+
+    added, skipped = storage.add_many(incoming, skip_existing=False)
+
+    assert [(a.name, a.command) for a in added] == [("gs", "git status -sb"), ("ll", "ls -l")]
+    assert skipped == 0
+    remove_op, import_op = storage.history.undo
+    assert remove_op["type"] == "remove"
+    assert remove_op["aliases"] == [original.to_dict()]
+    assert import_op["type"] == "import"
+    assert import_op["aliases"] == [a.to_dict() for a in added]
+
+
+def test_add_many__undo_round_trip(tmp_path):
+    storage = AliasStorage(storage_path=tmp_path / "aliases.json")
+    storage.add(Alias(name="gs", command="git status"), record_history=False)
+
+    storage.add_many([Alias(name="ll", command="ls -l"), Alias(name="la", command="ls -a")])
+    assert sorted(storage.aliases) == ["gs", "la", "ll"]
+
+    storage.history.perform_undo(storage)
+    assert sorted(storage.aliases) == ["gs"]
+    assert sorted(AliasStorage(storage_path=tmp_path / "aliases.json").aliases) == ["gs"]
+
+    storage.history.perform_redo(storage)
+    assert sorted(storage.aliases) == ["gs", "la", "ll"]
+
+
+def test_add_many__nothing_added(tmp_path):
+    storage = AliasStorage(storage_path=tmp_path / "aliases.json")
+
+    with patch.object(storage, "save") as mock_save:
+        assert storage.add_many([]) == ([], 0)
+
+    mock_save.assert_not_called()
+    assert storage.history.undo == []
+
+
+def test_bulk_update__single_save(tmp_path):
+    storage = AliasStorage(storage_path=tmp_path / "aliases.json")
+    storage.aliases = {
+        "gs": Alias(name="gs", command="git status"),
+        "ll": Alias(name="ll", command="ls -l"),
+    }
+    storage.aliases["gs"].group = "git"
+
+    with patch.object(storage, "save", wraps=storage.save) as mock_save:
+        storage.bulk_update([storage.aliases["gs"], Alias(name="gl", command="git log")], removals=["ll"])
+
+    mock_save.assert_called_once()
+    assert sorted(storage.aliases) == ["gl", "gs"]
+    assert [a.name for a in storage.get_by_group("git")] == ["gs"]
+    assert not (tmp_path / "aliases.json.tmp").exists()
+    assert sorted(AliasStorage(storage_path=tmp_path / "aliases.json").aliases) == ["gl", "gs"]
+
+
 @patch("alix.storage.shutil")
 def test_restore_latest_backup(mock_shutil):
     with patch("pathlib.Path.glob", autospec=True) as mock_glob:
@@ -238,6 +431,48 @@ def test_restore_latest_backup__no_backups(mock_shutil):
     mock_shutil.copy2.assert_not_called()
 
 
+def test_backup_count(tmp_path):
+    storage = AliasStorage(tmp_path / "aliases.json")
+    (storage.backup_dir / "aliases_20251024_200000.json").write_text("{}")
+    (storage.backup_dir / "aliases_20251024_210000.json").write_text("{}")
+    (storage.backup_dir / "notes.txt").write_text("")
+
+    assert storage.backup_count == 2
+
+
+def test_backup_count__tracks_new_and_pruned_backups(tmp_path, alias):
+    storage = AliasStorage(tmp_path / "aliases.json")
+    for hour in range(9):
+        (storage.backup_dir / f"aliases_20251023_{hour:02d}0000.json").write_text("{}")
+    assert storage.backup_count == 9
+
+    storage.aliases[alias.name] = alias
+    storage.save()
+    with freeze_time("2025-10-24 21:01:01"):
+        storage.create_backup()
+    assert storage.backup_count == 10
+
+    (storage.backup_dir / "aliases_20251022_000000.json").write_text("{}")
+    with freeze_time("2025-10-24 21:01:02"):
+        storage.create_backup()
+    assert storage.backup_count == 10
+    assert len(list(storage.backup_dir.glob("aliases_*.json"))) == 10
+
+
+@freeze_time("2025-10-24 21:01:01")
+def test_create_backup__reuses_backup_within_same_second(tmp_path, alias):
+    storage = AliasStorage(tmp_path / "aliases.json")
+    storage.aliases[alias.name] = alias
+    storage.save()
+
+    with patch("alix.storage.shutil") as mock_shutil:
+        first = storage.create_backup()
+        second = storage.create_backup()
+
+    assert first == second == storage.backup_dir / "aliases_20251024_210101.json"
+    mock_shutil.copy2.assert_called_once()
+
+
 class TestStorageGroupAndTagMethods:
     """Test storage methods for groups and tags"""
 
@@ -255,7 +490,7 @@ class TestStorageGroupAndTagMethods:
         """Test track_usage with non-existent alias"""
         storage = AliasStorage()
 
-        storage.track_usage("nonexistent_alias", "test context")
+        assert storage.track_usage("nonexistent_alias", "test context") is None
 
     def test_get_by_group(self):
         """Test get_by_group method"""
@@ -302,6 +537,56 @@ class TestStorageGroupAndTagMethods:
 
         assert groups == ["group1", "group2"]
 
+    def test_set_group_keeps_group_index_current(self, tmp_path):
+        """Test group lookups follow aliases regrouped through set_group without a save"""
+        storage = AliasStorage(tmp_path / "aliases.json")
+        storage.aliases = {"alias1": Alias(name="alias1", command="echo 1", group="group1")}
+        assert [a.name for a in storage.get_by_group("group1")] == ["alias1"]
+
+        assert storage.set_group("alias1", "group2") is storage.aliases["alias1"]
+        assert storage.set_group("missing", "group2") is None
+
+        assert storage.get_by_group("group1") == []
+        assert [a.name for a in storage.get_by_group("group2")] == ["alias1"]
+        assert storage.get_groups() == ["group2"]
+        assert [group for group, _ in storage.iter_groups()] == ["group2"]
+
+        storage.aliases["alias2"] = Alias(name="alias2", command="echo 2", group="group3")
+        assert storage.get_groups() == ["group2", "group3"]
+
+        storage.set_group("alias2", None)
+        assert [a.name for a in storage.get_by_group(None)] == ["alias2"]
+        del storage.aliases["alias2"]
+        assert storage.get_by_group(None) == []
+
+    def test_group_index_follows_replaced_aliases(self, tmp_path):
+        """Test writing an alias back into the dict reindexes it, even after an in-place edit"""
+        storage = AliasStorage(tmp_path / "aliases.json")
+        storage.aliases = {"alias1": Alias(name="alias1", command="echo 1", group="group1")}
+        assert storage.get_groups() == ["group1"]
+
+        alias = storage.aliases["alias1"]
+        alias.group = "group2"
+        storage.aliases["alias1"] = alias
+
+        assert storage.get_by_group("group1") == []
+        assert storage.get_by_group("group2") == [alias]
+
+    def test_iter_groups(self):
+        """Test iter_groups yields groups sorted by display name, ungrouped aliases listed as Ungrouped"""
+        storage = AliasStorage()
+        storage.aliases = {
+            "b": Alias(name="b", command="echo b", group="web"),
+            "z": Alias(name="z", command="echo z"),
+            "a": Alias(name="a", command="echo a", group="web"),
+            "c": Alias(name="c", command="echo c", group="db"),
+            "d": Alias(name="d", command="echo d", group="Apps"),
+        }
+
+        groups = [(group, [a.name for a in aliases]) for group, aliases in storage.iter_groups()]
+
+        assert groups == [("Apps", ["d"]), (None, ["z"]), ("db", ["c"]), ("web", ["a", "b"])]
+
     def test_remove_group_empty(self):
         """Test remove_group with no aliases in group"""
         storage = AliasStorage()
@@ -399,6 +684,47 @@ class TestStorageGroupAndTagMethods:
 
         assert tags == ["tag1", "tag2", "tag3"]
 
+    def test_iter_tags(self):
+        """Test iter_tags yields sorted tags with their aliases in name order"""
+        storage = AliasStorage()
+        storage.aliases = {
+            "b": Alias(name="b", command="echo b", tags=["web"]),
+            "a": Alias(name="a", command="echo a", tags=["web", "db"]),
+        }
+
+        tags = [(tag, [a.name for a in aliases]) for tag, aliases in storage.iter_tags()]
+
+        assert tags == [("db", ["a"]), ("web", ["a", "b"])]
+
+    def test_set_tags_keeps_tag_index_current(self, tmp_path):
+        """Test tag lookups follow tags replaced through set_tags without a save"""
+        storage = AliasStorage(tmp_path / "aliases.json")
+        alias = Alias(name="a", command="echo a", tags=["old"])
+        storage.aliases = {"a": alias}
+        assert storage.get_by_tag("old") == [alias]
+
+        assert storage.set_tags("a", ["new"]) is alias
+
+        assert alias.tags == ["new"]
+        assert storage.get_by_tag("old") == []
+        assert storage.get_by_tag("new") == [alias]
+        assert storage.get_tags() == ["new"]
+        assert [tag for tag, _ in storage.iter_tags()] == ["new"]
+        assert storage.set_tags("missing", ["new"]) is None
+
+    def test_get_by_tags(self):
+        """Test get_by_tags matches any or all of the tags"""
+        storage = AliasStorage()
+        storage.aliases = {
+            "b": Alias(name="b", command="echo b", tags=["web", "db"]),
+            "a": Alias(name="a", command="echo a", tags=["web"]),
+            "c": Alias(name="c", command="echo c", tags=["db"]),
+        }
+
+        assert [a.name for a in storage.get_by_tags(["web", "db"])] == ["a", "b", "c"]
+        assert [a.name for a in storage.get_by_tags(["web", "db"], match_all=True)] == ["b"]
+        assert storage.get_by_tags(["web", "missing"], match_all=True) == []
+
     def test_get_tag_counts(self):
         """Test get_tag_counts method"""
         storage = AliasStorage()
@@ -1,15 +1,26 @@
+from operator import attrgetter
 from unittest.mock import ANY, patch
 
 import pytest
 import datetime
 
 from alix.models import Alias
+from alix.scanner import AliasScanner
 from alix.shell_integrator import ShellIntegrator
 from alix.tui import AliasManager, HelpModal, AddAliasModal, EditAliasModal, DeleteConfirmModal
 from textual.widgets import Static, DataTable, Input
 from pathlib import Path
 
 
+def _serve_index(storage, aliases):
+    """Answer the group and tag index lookups of a mocked storage from a plain alias list"""
+    storage.get_groups.return_value = sorted({alias.group for alias in aliases if alias.group})
+    storage.get_tags.return_value = sorted({tag for alias in aliases for tag in alias.tags})
+    storage.get_by_group.side_effect = lambda group: sorted(
+        (alias for alias in aliases if alias.group == group), key=attrgetter("name")
+    )
+
+
 @pytest.mark.asyncio
 @patch.object(ShellIntegrator, "apply_single_alias")
 @patch.object(AliasManager, "notify")
@@ -95,17 +106,16 @@ async def test_edit_alias(mock_storage, mock_notify, mock_apply, alias_min):
 
 
 @pytest.mark.asyncio
-@patch("alix.tui.subprocess.run")
+@patch.object(AliasScanner, "find_existing_command")
 @patch("alix.tui.AliasStorage", autospec=True)
 @patch.object(AliasManager, "notify")
 @patch.object(ShellIntegrator, "apply_single_alias")
-async def test_add_alias_with_conflicts_and_apply_failure(mock_apply, mock_notify, mock_storage, mock_subprocess):
+async def test_add_alias_with_conflicts_and_apply_failure(mock_apply, mock_notify, mock_storage, mock_find_existing):
     # Mock no storage conflict
     mock_storage.return_value.get.return_value = None
 
     # Mock shell conflict
-    mock_subprocess.return_value.returncode = 0
-    mock_subprocess.return_value.stdout = "alias test-alias='echo test'"
+    mock_find_existing.return_value = "test-alias: aliased to echo test (in .zshrc)"
 
     # Mock apply failure
     mock_apply.return_value = (False, "Apply failed")
@@ -127,12 +137,14 @@ async def test_add_alias_with_conflicts_and_apply_failure(mock_apply, mock_notif
 
         # Verify shell conflict message notification
         mock_notify.assert_any_call(
-            "Alias/Command/Function already exists\nEnable Force Override if you want to override this alias\nalias test-alias='echo test'",
+            "Alias/Command/Function already exists\n"
+            "Enable Force Override if you want to override this alias\n"
+            "test-alias: aliased to echo test (in .zshrc)",
             severity="error",
         )
 
-        # Verify subprocess was called for conflict check
-        mock_subprocess.assert_called()
+        # Verify the shell was checked for a conflict
+        mock_find_existing.assert_called_once_with("test-alias")
 
         # Verify storage add was not called due to conflict
         mock_storage.return_value.add.assert_not_called()
@@ -142,18 +154,17 @@ async def test_add_alias_with_conflicts_and_apply_failure(mock_apply, mock_notif
 
 
 @pytest.mark.asyncio
-@patch("alix.tui.subprocess.run")
+@patch.object(AliasScanner, "find_existing_command")
 @patch.object(ShellIntegrator, "apply_single_alias")
 @patch.object(AliasManager, "notify")
 @patch("alix.tui.AliasStorage", autospec=True)
-async def test_add_alias_with_existing_conflict(mock_storage, mock_notify, mock_apply, mock_subprocess):
+async def test_add_alias_with_existing_conflict(mock_storage, mock_notify, mock_apply, mock_find_existing):
     # Mock storage to return existing alias
     existing_alias = Alias(name="test-alias", command="echo existing", description="existing desc")
     mock_storage.return_value.get.return_value = existing_alias
 
-    # Mock subprocess for shell conflict
-    mock_subprocess.return_value.returncode = 0
-    mock_subprocess.return_value.stdout = "alias test-alias='echo shell'"
+    # Mock shell conflict
+    mock_find_existing.return_value = "test-alias: aliased to echo shell (in .zshrc)"
 
     # Mock apply failure
     mock_apply.return_value = (False, "Apply failed")
@@ -179,8 +190,8 @@ async def test_add_alias_with_existing_conflict(mock_storage, mock_notify, mock_
             severity="error",
         )
 
-        # Assert subprocess not called because storage conflict takes precedence
-        mock_subprocess.assert_not_called()
+        # Assert the shell is not checked because storage conflict takes precedence
+        mock_find_existing.assert_not_called()
 
         # Assert storage.add not called
         mock_storage.return_value.add.assert_not_called()
@@ -259,6 +270,7 @@ async def test_fuzzy_search_and_filters(mock_storage):
         ),
     ]
     mock_storage.return_value.list_all.return_value = aliases
+    _serve_index(mock_storage.return_value, aliases)
 
     app = AliasManager()
 
@@ -357,6 +369,7 @@ async def test_alias_management_actions(mock_storage, mock_notify, mock_clipboar
         ),
     ]
     mock_storage.return_value.list_all.return_value = aliases
+    _serve_index(mock_storage.return_value, aliases)
     mock_storage.return_value.remove.return_value = True
     mock_apply_aliases.return_value = (True, "Applied")
     mock_storage.return_value.get.return_value.command = "ls -la"
@@ -429,14 +442,13 @@ async def test_add_alias_empty_fields(mock_storage, mock_notify):
 @patch.object(ShellIntegrator, "apply_single_alias")
 @patch.object(AliasManager, "notify")
 @patch("alix.tui.AliasStorage", autospec=True)
-@patch("alix.tui.subprocess.run")
-async def test_add_alias_apply_failure_after_conflicts(mock_subprocess, mock_storage, mock_notify, mock_apply):
+@patch.object(AliasScanner, "find_existing_command")
+async def test_add_alias_apply_failure_after_conflicts(mock_find_existing, mock_storage, mock_notify, mock_apply):
     # Mock no storage conflict
     mock_storage.return_value.get.return_value = None
 
     # Mock shell conflict
-    mock_subprocess.return_value.returncode = 0
-    mock_subprocess.return_value.stdout = "alias test-alias='echo test'"
+    mock_find_existing.return_value = "test-alias: aliased to echo test (in .zshrc)"
 
     # Mock apply failure
     mock_apply.return_value = (False, "Apply failed")
@@ -498,14 +510,13 @@ async def test_add_alias_cancel(mock_storage):
 
 
 @pytest.mark.asyncio
-@patch("alix.tui.subprocess.run")
+@patch.object(AliasScanner, "find_existing_command", return_value=None)  # No shell conflict
 @patch.object(ShellIntegrator, "apply_single_alias")
 @patch.object(AliasManager, "notify")
 @patch("alix.tui.AliasStorage", autospec=True)
-async def test_add_alias_storage_failure(mock_storage, mock_notify, mock_apply, mock_subprocess):
+async def test_add_alias_storage_failure(mock_storage, mock_notify, mock_apply, mock_find_existing):
     mock_storage.return_value.add.return_value = False
     mock_storage.return_value.get.return_value = None
-    mock_subprocess.return_value.returncode = 1  # No shell conflict
 
     app = AliasManager()
 
@@ -865,6 +876,7 @@ async def test_filter_by_group_value_error(mock_storage):
         ),
     ]
     mock_storage.return_value.list_all.return_value = aliases
+    _serve_index(mock_storage.return_value, aliases)
 
     app = AliasManager()
 
@@ -963,6 +975,7 @@ async def test_empty_filter_states(mock_storage):
     """Test handling of empty filter states when no aliases match or none exist."""
     # Start with no aliases
     mock_storage.return_value.list_all.return_value = []
+    _serve_index(mock_storage.return_value, [])
 
     app = AliasManager()
 
@@ -138,6 +138,18 @@ class TestUsageTracker:
         assert "alias2" in analytics.unused_aliases
         assert analytics.average_usage_per_alias == 5.0
     
+    def test_get_usage_analytics_top_k(self, usage_tracker):
+        """Test that only the top_k most productive aliases are ranked"""
+        aliases = [
+            Alias(name="a", command="echo a"),
+            Alias(name="b", command="echo bbbbbb"),
+            Alias(name="c", command="echo ccc"),
+        ]
+        
+        analytics = usage_tracker.get_usage_analytics(aliases, top_k=2)
+        
+        assert analytics.most_productive_aliases == [("b", 10), ("c", 7)]
+    
     def test_get_alias_usage_history(self, usage_tracker):
         """Test getting usage history for a specific alias"""
         # Track some usage
@@ -148,6 +160,10 @@ class TestUsageTracker:
         
         assert len(history) == 2
         assert all("date" in record for record in history)
+        assert all(
+            record["display_date"] == datetime.fromisoformat(record["date"]).strftime("%Y-%m-%d %H:%M")
+            for record in history
+        )
     
     def test_cleanup_old_data(self, usage_tracker):
         """Test cleaning up old tracking data"""
@@ -298,10 +314,11 @@ class TestAliasStorageIntegration:
         storage.add(alias)
         
         # Track usage
-        storage.track_usage("test", "test context")
+        tracked_alias = storage.track_usage("test", "test context")
         
         # Check that usage was recorded
         updated_alias = storage.get("test")
+        assert tracked_alias is updated_alias
         assert updated_alias.used_count == 1
         assert updated_alias.last_used is not None
         assert len(updated_alias.usage_history) == 1